@@ -8,10 +8,14 @@ import logging
 import signal
 import sys
 
-from aws_mcp_server.server import logger, mcp
+from aws_mcp_server.config import TRANSPORT
+from aws_mcp_server.server import logger, mcp, run_startup_checks
 
-# Configure root logger
-logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s", handlers=[logging.StreamHandler(sys.stderr)])
+try:
+    import uvloop
+except ImportError:
+    # uvloop is not available on Windows; fall back to the stdlib event loop
+    uvloop = None
 
 
 def handle_interrupt(signum, frame):
@@ -20,24 +24,37 @@ def handle_interrupt(signum, frame):
     sys.exit(0)
 
 
-# Using FastMCP's built-in CLI handling
-if __name__ == "__main__":
+def main():
+    """Configure logging and run the MCP server with the configured transport."""
+    # Configure root logger here rather than at import time
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s", handlers=[logging.StreamHandler(sys.stderr)])
+
     # Set up signal handler for graceful shutdown
     signal.signal(signal.SIGINT, handle_interrupt)
     signal.signal(signal.SIGTERM, handle_interrupt)
 
     try:
-        # Use configured transport protocol
-        from aws_mcp_server.config import TRANSPORT
-
         # Validate transport protocol
         if TRANSPORT not in ("stdio", "sse"):
             logger.error(f"Invalid transport protocol: {TRANSPORT}. Must be 'stdio' or 'sse'")
             sys.exit(1)
 
+        # Verify the AWS CLI is available before accepting requests
+        run_startup_checks()
+
         # Run with the specified transport protocol
         logger.info(f"Starting server with transport protocol: {TRANSPORT}")
-        mcp.run(transport=TRANSPORT)
+        if uvloop is not None:
+            # Run on a libuv-based event loop without installing a global loop policy
+            run_server = mcp.run_stdio_async if TRANSPORT == "stdio" else mcp.run_sse_async
+            uvloop.run(run_server())
+        else:
+            mcp.run(transport=TRANSPORT)
     except KeyboardInterrupt:
         logger.info("Keyboard interrupt received. Shutting down gracefully...")
         sys.exit(0)
+
+
+# Using FastMCP's built-in CLI handling
+if __name__ == "__main__":
+    main()
@@ -5,14 +5,23 @@ It exposes AWS CLI operations, security validations, and resource management
 through HTTP endpoints.
 """
 
+import asyncio
+import functools
 import logging
-from typing import Dict, List, Optional, Union
+import os
+import time
+from typing import Any, Dict, List, Optional, Tuple, Union
 
-from fastapi import FastAPI, HTTPException, Request
+import anyio
+import orjson
+from fastapi import FastAPI, HTTPException, Response
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import ORJSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel
 
 from aws_mcp_server.cli_executor import check_aws_cli_installed
+from aws_mcp_server.config import ACCESS_LOG, API_WORKERS
 from aws_mcp_server.server import aws_cli_help, aws_cli_pipeline
 from aws_mcp_server.resources import (
     get_aws_account_info,
@@ -25,11 +34,38 @@ from aws_mcp_server.resources import (
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Worker threads available for blocking boto3 and config file calls
+THREADPOOL_SIZE = 32
+
+# Concurrent boto3 calls allowed before new requests are shed with a 503
+MAX_CONCURRENT_AWS_CALLS = 16
+AWS_CALL_TIMEOUT = 5
+AWS_CALL_RETRY_AFTER = "2"
+AWS_CALL_SEMAPHORE = asyncio.Semaphore(MAX_CONCURRENT_AWS_CALLS)
+
+# Uncached region details page through Service Quotas, which often takes well over AWS_CALL_TIMEOUT
+REGION_DETAILS_TIMEOUT = 30
+
+# Successful account and region lookups rarely change, so let clients and proxies cache them
+RESOURCE_CACHE_CONTROL = "max-age=3600"
+
+# Credential state rarely changes, so environment lookups are reused for a few seconds
+ENVIRONMENT_CACHE_TTL = 10
+_environment_cache: Optional[Tuple[float, Dict[str, Any]]] = None
+
+# The root endpoint always returns the same payload, so it is serialized once
+ROOT_RESPONSE_BODY = orjson.dumps({
+    "name": "AWS MCP Server API",
+    "version": "1.0.0",
+    "status": "running"
+})
+
 # Create FastAPI app
 app = FastAPI(
     title="AWS MCP Server API",
     description="REST API for AWS MCP Server operations",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=ORJSONResponse
 )
 
 # Add CORS middleware
@@ -46,11 +82,63 @@ app.add_middleware(
 async def startup_event():
     """Perform startup checks when the API server starts."""
     logger.info("Performing startup checks...")
+    anyio.to_thread.current_default_thread_limiter().total_tokens = THREADPOOL_SIZE
     if not await check_aws_cli_installed():
         logger.error("AWS CLI is not installed or not accessible")
         raise RuntimeError("AWS CLI is not installed or not accessible")
     logger.info("Startup checks completed successfully")
 
+def _release_aws_call_slot(call: asyncio.Future) -> None:
+    """Release a concurrency slot once an AWS call has actually finished.
+
+    Args:
+        call: The finished AWS call
+    """
+    AWS_CALL_SEMAPHORE.release()
+    if not call.cancelled():
+        # Mark the error as retrieved so calls abandoned after a timeout are not logged as unhandled
+        call.exception()
+
+async def run_aws_call(func, *args, timeout: float = AWS_CALL_TIMEOUT):
+    """Run a boto3 call with bounded concurrency.
+
+    Blocking functions run in the threadpool; coroutine functions are awaited
+    directly. Waiting for a free slot and running the call share one deadline,
+    so slow or throttled AWS APIs shed load instead of queueing requests indefinitely.
+    The slot is held until the call itself finishes, even after the request has
+    timed out, so abandoned calls still count against MAX_CONCURRENT_AWS_CALLS.
+
+    Args:
+        func: Blocking function or coroutine function that calls AWS
+        *args: Positional arguments for func
+        timeout: Seconds to wait for a slot and the call to complete
+
+    Returns:
+        The result of func
+
+    Raises:
+        HTTPException: 503 with a Retry-After header if the deadline is exceeded
+    """
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
+    try:
+        await asyncio.wait_for(AWS_CALL_SEMAPHORE.acquire(), timeout=timeout)
+        if asyncio.iscoroutinefunction(func):
+            call = asyncio.ensure_future(func(*args))
+        else:
+            call = asyncio.ensure_future(anyio.to_thread.run_sync(functools.partial(func, *args)))
+        call.add_done_callback(_release_aws_call_slot)
+
+        # Shield the call so a timeout abandons it without releasing its slot early
+        return await asyncio.wait_for(asyncio.shield(call), timeout=deadline - loop.time())
+    except asyncio.TimeoutError as e:
+        logger.warning(f"AWS call {func.__name__} did not complete within {timeout} seconds")
+        raise HTTPException(
+            status_code=503,
+            detail="AWS is not responding, please retry later",
+            headers={"Retry-After": AWS_CALL_RETRY_AFTER}
+        ) from e
+
 # Pydantic models
 class AwsCommandRequest(BaseModel):
     """Model for AWS CLI command requests."""
@@ -62,6 +150,8 @@ class AwsHelpRequest(BaseModel):
     service: str
     command: Optional[str] = None
 
+# Response models are only referenced from ``responses=`` for the OpenAPI docs,
+# so FastAPI does not re-validate the already well-formed dicts on every request.
 class AwsProfilesResponse(BaseModel):
     """Model for AWS profiles response."""
     profiles: List[Dict[str, Union[str, bool]]]
@@ -79,11 +169,7 @@ class AwsRegionResponse(BaseModel):
 @app.get("/")
 async def root():
     """Root endpoint returning API information."""
-    return {
-        "name": "AWS MCP Server API",
-        "version": "1.0.0",
-        "status": "running"
-    }
+    return Response(content=ROOT_RESPONSE_BODY, media_type="application/json")
 
 @app.post("/aws/execute")
 async def execute_aws_command(request: AwsCommandRequest):
@@ -111,66 +197,95 @@ async def get_aws_help(request: AwsHelpRequest):
         logger.error(f"Error getting AWS help: {str(e)}")
         raise HTTPException(status_code=500, detail=str(e))
 
-@app.get("/aws/profiles", response_model=AwsProfilesResponse)
+@app.get("/aws/profiles", responses={200: {"model": AwsProfilesResponse}})
 async def get_profiles():
     """Get available AWS profiles."""
-    try:
-        profiles = get_aws_profiles()
-        env = get_aws_environment()
-        current_profile = env.get("aws_profile")
-
-        return {
-            "profiles": [
-                {
-                    "name": profile,
-                    "is_current": profile == current_profile
-                }
-                for profile in profiles
-            ]
-        }
-    except Exception as e:
-        logger.error(f"Error getting AWS profiles: {str(e)}")
-        raise HTTPException(status_code=500, detail=str(e))
+    profiles = await run_in_threadpool(get_aws_profiles)
+    current_profile = os.environ.get("AWS_PROFILE", "default")
+
+    return {
+        "profiles": [
+            {
+                "name": profile,
+                "is_current": profile == current_profile
+            }
+            for profile in profiles
+        ]
+    }
 
 @app.get("/aws/environment")
 async def get_environment():
     """Get AWS environment information."""
-    try:
-        return get_aws_environment()
-    except Exception as e:
-        logger.error(f"Error getting AWS environment: {str(e)}")
-        raise HTTPException(status_code=500, detail=str(e))
+    global _environment_cache
+    now = time.monotonic()
+    if _environment_cache is not None and _environment_cache[0] > now:
+        return _environment_cache[1]
+
+    env_info = await run_aws_call(get_aws_environment)
+    _environment_cache = (now + ENVIRONMENT_CACHE_TTL, env_info)
+    return env_info
 
 @app.get("/aws/account")
-async def get_account():
+async def get_account(response: Response):
     """Get AWS account information."""
-    try:
-        return get_aws_account_info()
-    except Exception as e:
-        logger.error(f"Error getting AWS account info: {str(e)}")
-        raise HTTPException(status_code=500, detail=str(e))
+    account_info = await run_aws_call(get_aws_account_info)
+    # A failed STS lookup returns placeholders that must not be cached downstream
+    if account_info["account_id"]:
+        response.headers["Cache-Control"] = RESOURCE_CACHE_CONTROL
+    return account_info
 
-@app.get("/aws/regions/{region_code}", response_model=AwsRegionResponse)
-async def get_region(region_code: str):
+@app.get("/aws/regions/{region_code}", responses={200: {"model": AwsRegionResponse}})
+async def get_region(region_code: str, response: Response):
     """Get detailed information about an AWS region."""
-    try:
-        return get_region_details(region_code)
-    except Exception as e:
-        logger.error(f"Error getting region details: {str(e)}")
-        raise HTTPException(status_code=500, detail=str(e))
+    region_details = await run_aws_call(get_region_details, region_code, timeout=REGION_DETAILS_TIMEOUT)
+    # Without availability zones the EC2 lookup failed and the details are only defaults
+    if region_details["availability_zones"]:
+        response.headers["Cache-Control"] = RESOURCE_CACHE_CONTROL
+    return region_details
+
+class RequestLoggingMiddleware:
+    """ASGI middleware to log all requests.
+
+    Implemented as plain ASGI rather than with @app.middleware("http"), which
+    wraps every request in Starlette's slower BaseHTTPMiddleware adapter.
+    """
+
+    def __init__(self, app):
+        self.app = app
 
-@app.middleware("http")
-async def log_requests(request: Request, call_next):
-    """Middleware to log all requests."""
-    logger.info(f"Request: {request.method} {request.url}")
-    response = await call_next(request)
-    logger.info(f"Response status: {response.status_code}")
-    return response
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not logger.isEnabledFor(logging.INFO):
+            await self.app(scope, receive, send)
+            return
+
+        query_string = scope.get("query_string", b"")
+        path = scope["path"] + (f"?{query_string.decode('latin-1')}" if query_string else "")
+        logger.info(f"Request: {scope['method']} {path}")
+
+        async def send_with_logging(message):
+            if message["type"] == "http.response.start":
+                logger.info(f"Response status: {message['status']}")
+            await send(message)
+
+        await self.app(scope, receive, send_with_logging)
+
+if ACCESS_LOG:
+    app.add_middleware(RequestLoggingMiddleware)
 
 def main():
     """Run the API server."""
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8000)
+
+    # "auto" selects uvloop when it is installed (not available on Windows)
+    uvicorn.run(
+        "aws_mcp_server.api:app",
+        host="0.0.0.0",
+        port=8000,
+        loop="auto",
+        http="httptools",
+        workers=API_WORKERS,
+        access_log=False  # requests are logged by RequestLoggingMiddleware when AWS_MCP_ACCESS_LOG is on
+    )
 
 if __name__ == "__main__":
     main()
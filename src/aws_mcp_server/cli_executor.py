@@ -5,22 +5,67 @@ with proper error handling, timeouts, and output processing.
 """
 
 import asyncio
+import datetime
+import json
 import logging
-import shlex
-from typing import TypedDict
+import re
+from collections import OrderedDict
+from typing import Any, TypedDict
 
-from aws_mcp_server.config import DEFAULT_TIMEOUT, MAX_OUTPUT_SIZE
+from aws_mcp_server.config import DEFAULT_TIMEOUT
 from aws_mcp_server.security import validate_aws_command, validate_pipe_command
 from aws_mcp_server.tools import (
     CommandResult,
+    communicate_with_limit,
+    decode_output,
     execute_piped_command,
-    is_pipe_command,
+    split_command,
     split_pipe_command,
 )
 
 # Configure module logger
 logger = logging.getLogger(__name__)
 
+# Error messages that indicate missing, expired or invalid AWS credentials
+AUTH_ERROR_PATTERNS = [
+    "Unable to locate credentials",
+    "ExpiredToken",
+    "AccessDenied",
+    "AuthFailure",
+    "The security token included in the request is invalid",
+    "The config profile could not be found",
+    "UnrecognizedClientException",
+    "InvalidClientTokenId",
+    "InvalidAccessKeyId",
+    "SignatureDoesNotMatch",
+    "Your credential profile is not properly configured",
+    "credentials could not be refreshed",
+    "NoCredentialProviders",
+]
+
+# All auth error patterns combined, so stderr is scanned once instead of once per pattern
+_AUTH_ERROR_RE = re.compile("|".join(re.escape(pattern) for pattern in AUTH_ERROR_PATTERNS))
+
+# Read-only commands answered with a cached boto3 client instead of a new AWS CLI process,
+# mapped to the boto3 (service, operation) whose response the CLI prints
+BOTO3_COMMANDS: dict[tuple[str, str], tuple[str, str]] = {
+    ("sts", "get-caller-identity"): ("sts", "get_caller_identity"),
+    ("ec2", "describe-regions"): ("ec2", "describe_regions"),
+}
+
+# Set once the AWS CLI has been found, so the check runs only once per process
+_aws_cli_installed = False
+
+# Serializes the first checks so concurrent callers share a single `aws --version` process
+_aws_cli_check_lock = asyncio.Lock()
+
+# Output of `aws --version`, recorded by check_aws_cli_installed and used to key the help cache
+_aws_cli_version: str | None = None
+
+# Help text only changes with the AWS CLI version, so successful lookups are kept in an LRU cache
+HELP_CACHE_SIZE = 256
+_help_cache: OrderedDict[tuple[str, str | None, str | None], "CommandHelpResult"] = OrderedDict()
+
 
 class CommandHelpResult(TypedDict):
     """Type definition for command help results."""
@@ -57,45 +102,158 @@ def is_auth_error(error_output: str) -> bool:
     Returns:
         True if the error is related to authentication, False otherwise
     """
-    auth_error_patterns = [
-        "Unable to locate credentials",
-        "ExpiredToken",
-        "AccessDenied",
-        "AuthFailure",
-        "The security token included in the request is invalid",
-        "The config profile could not be found",
-        "UnrecognizedClientException",
-        "InvalidClientTokenId",
-        "InvalidAccessKeyId",
-        "SignatureDoesNotMatch",
-        "Your credential profile is not properly configured",
-        "credentials could not be refreshed",
-        "NoCredentialProviders",
-    ]
-    return any(pattern in error_output for pattern in auth_error_patterns)
+    return _AUTH_ERROR_RE.search(error_output) is not None
 
 
 async def check_aws_cli_installed() -> bool:
     """Check if AWS CLI is installed and accessible.
 
+    A successful check is remembered, so later calls do not spawn another
+    `aws --version` process, and concurrent first calls wait for a single
+    check. Failed checks are retried on the next call.
+
     Returns:
         True if AWS CLI is installed, False otherwise
     """
-    try:
-        # Split command safely for exec
-        cmd_parts = ["aws", "--version"]
+    global _aws_cli_installed, _aws_cli_version
+    if _aws_cli_installed:
+        return True
 
-        # Create subprocess using exec (safer than shell=True)
-        process = await asyncio.create_subprocess_exec(*cmd_parts, stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE)
-        await process.communicate()
-        return process.returncode == 0
-    except Exception:
-        return False
+    async with _aws_cli_check_lock:
+        # Another caller may have finished the check while we waited
+        if _aws_cli_installed:
+            return True
+
+        try:
+            # Split command safely for exec
+            cmd_parts = ["aws", "--version"]
+
+            # Create subprocess using exec (safer than shell=True)
+            process = await asyncio.create_subprocess_exec(*cmd_parts, stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE)
+            stdout, stderr = await process.communicate()
+            _aws_cli_installed = process.returncode == 0
+            if _aws_cli_installed:
+                # AWS CLI v1 prints its version to stderr, v2 to stdout
+                _aws_cli_version = (stdout or stderr).decode("utf-8", errors="replace").strip()
+            return _aws_cli_installed
+        except Exception:
+            return False
 
 
 # Command validation functions are now imported from aws_mcp_server.security
 
 
+def _json_default(value: Any) -> str:
+    """Serialize values the way the AWS CLI JSON formatter does.
+
+    Args:
+        value: Value that json cannot serialize natively
+
+    Returns:
+        String form of the value
+    """
+    if isinstance(value, (datetime.datetime, datetime.date)):
+        return value.isoformat()
+    return str(value)
+
+
+def _error_result(error_output: str) -> CommandResult:
+    """Build the result reported for a failed AWS command.
+
+    Args:
+        error_output: Error message from the AWS CLI or boto3
+
+    Returns:
+        CommandResult with error status
+    """
+    if is_auth_error(error_output):
+        return CommandResult(status="error", output=f"Authentication error: {error_output}\nPlease check your AWS credentials.")
+
+    return CommandResult(status="error", output=error_output or "Command failed with no error output")
+
+
+def _parse_boto3_command(cmd_parts: list[str]) -> tuple[str, str, str | None, str | None, str | None] | None:
+    """Match a split command against BOTO3_COMMANDS.
+
+    Only commands without operation arguments are matched, optionally with
+    --region, --profile and --output, so the boto3 call is exactly the one
+    the AWS CLI would make.
+
+    Args:
+        cmd_parts: Split AWS CLI command
+
+    Returns:
+        Tuple of (service, operation, region, profile, output) or None if the command must run through the AWS CLI
+    """
+    if len(cmd_parts) < 3 or cmd_parts[0] != "aws" or (cmd_parts[1], cmd_parts[2]) not in BOTO3_COMMANDS:
+        return None
+
+    options: dict[str, str] = {}
+    rest = cmd_parts[3:]
+    if len(rest) % 2:
+        return None
+    for name, value in zip(rest[::2], rest[1::2], strict=True):
+        if name not in ("--region", "--profile", "--output") or name in options:
+            return None
+        options[name] = value
+
+    service, operation = BOTO3_COMMANDS[(cmd_parts[1], cmd_parts[2])]
+    return service, operation, options.get("--region"), options.get("--profile"), options.get("--output")
+
+
+async def execute_aws_command_via_boto3(cmd_parts: list[str], timeout: int) -> CommandResult | None:
+    """Run a simple read-only AWS CLI command through a cached boto3 client.
+
+    Starting the AWS CLI costs far more than these calls themselves, so
+    commands listed in BOTO3_COMMANDS are answered in-process when their
+    output would be JSON. The response is printed the way the CLI prints it.
+
+    Args:
+        cmd_parts: Split AWS CLI command
+        timeout: Timeout in seconds
+
+    Returns:
+        CommandResult, or None if the command should run through the AWS CLI instead
+
+    Raises:
+        CommandExecutionError: If the call times out or fails unexpectedly
+    """
+    parsed = _parse_boto3_command(cmd_parts)
+    if parsed is None:
+        return None
+    service, operation, region, profile, output = parsed
+
+    # Imported here so that boto3 is only loaded once a matching command is run
+    from botocore.exceptions import BotoCoreError, ClientError
+
+    from aws_mcp_server.resources import get_cached_client, get_default_output
+
+    def call() -> str | None:
+        # Only JSON output can be reproduced exactly, so other formats go to the CLI
+        if (output or get_default_output(profile)) != "json":
+            return None
+
+        response = getattr(get_cached_client(service, profile, region), operation)()
+        response.pop("ResponseMetadata", None)
+        return json.dumps(response, indent=4, default=_json_default, ensure_ascii=False) + "\n"
+
+    try:
+        stdout = await asyncio.wait_for(asyncio.to_thread(call), timeout)
+    except asyncio.TimeoutError as timeout_error:
+        logger.warning("Command timed out after %s seconds: %s", timeout, " ".join(cmd_parts))
+        raise CommandExecutionError(f"Command timed out after {timeout} seconds") from timeout_error
+    except (BotoCoreError, ClientError) as e:
+        # Report AWS errors the way the CLI path does rather than running the command a second time
+        logger.warning("Command failed: %s", " ".join(cmd_parts))
+        return _error_result(str(e))
+    except Exception as e:
+        raise CommandExecutionError(f"Failed to execute command: {str(e)}") from e
+
+    if stdout is None:
+        return None
+    return CommandResult(status="success", output=decode_output(stdout.encode("utf-8")))
+
+
 async def execute_aws_command(command: str, timeout: int | None = None) -> CommandResult:
     """Execute an AWS CLI command and return the result.
 
@@ -114,7 +272,7 @@ async def execute_aws_command(command: str, timeout: int | None = None) -> Comma
         CommandExecutionError: If the command fails to execute
     """
     # Check if this is a piped command
-    if is_pipe_command(command):
+    if len(split_pipe_command(command)) > 1:
         return await execute_pipe_command(command, timeout)
 
     # Validate the command
@@ -131,57 +289,49 @@ async def execute_aws_command(command: str, timeout: int | None = None) -> Comma
     from aws_mcp_server.config import AWS_REGION
 
     # Split by spaces and check for EC2 service specifically
-    cmd_parts = shlex.split(command)
+    cmd_parts = split_command(command)
     is_ec2_command = len(cmd_parts) >= 2 and cmd_parts[0] == "aws" and cmd_parts[1] == "ec2"
     has_region = "--region" in cmd_parts
 
     # If it's an EC2 command and doesn't have --region
     if is_ec2_command and not has_region:
-        # Add the region parameter
+        # Add the region parameter to the already split argv rather than re-parsing the command
+        cmd_parts.extend(("--region", AWS_REGION))
         command = f"{command} --region {AWS_REGION}"
-        logger.debug(f"Added region to command: {command}")
+        logger.debug("Added region to command: %s", command)
 
-    logger.debug(f"Executing AWS command: {command}")
+    result = await execute_aws_command_via_boto3(cmd_parts, timeout)
+    if result is not None:
+        return result
 
-    try:
-        # Split command safely for exec
-        cmd_parts = shlex.split(command)
+    logger.debug("Executing AWS command: %s", command)
 
+    try:
         # Create subprocess using exec (safer than shell=True)
         process = await asyncio.create_subprocess_exec(*cmd_parts, stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE)
 
         # Wait for the process to complete with timeout
         try:
-            stdout, stderr = await asyncio.wait_for(process.communicate(), timeout)
-            logger.debug(f"Command completed with return code: {process.returncode}")
+            stdout, stderr, truncated = await asyncio.wait_for(communicate_with_limit(process), timeout)
+            logger.debug("Command completed with return code: %s", process.returncode)
         except asyncio.TimeoutError as timeout_error:
-            logger.warning(f"Command timed out after {timeout} seconds: {command}")
+            logger.warning("Command timed out after %s seconds: %s", timeout, command)
             try:
                 # process.kill() is synchronous, not a coroutine
                 process.kill()
             except Exception as e:
-                logger.error(f"Error killing process: {e}")
+                logger.error("Error killing process: %s", e)
             raise CommandExecutionError(f"Command timed out after {timeout} seconds") from timeout_error
 
-        # Process output
-        stdout_str = stdout.decode("utf-8", errors="replace")
-        stderr_str = stderr.decode("utf-8", errors="replace")
-
-        # Truncate output if necessary
-        if len(stdout_str) > MAX_OUTPUT_SIZE:
-            logger.info(f"Output truncated from {len(stdout_str)} to {MAX_OUTPUT_SIZE} characters")
-            stdout_str = stdout_str[:MAX_OUTPUT_SIZE] + "\n... (output truncated)"
+        # A process stopped for producing too much output is not a failure
+        if process.returncode != 0 and not truncated:
+            stderr_str = decode_output(stderr)
+            logger.warning("Command failed with return code %s: %s", process.returncode, command)
+            logger.debug("Command error output: %s", stderr_str)
 
-        if process.returncode != 0:
-            logger.warning(f"Command failed with return code {process.returncode}: {command}")
-            logger.debug(f"Command error output: {stderr_str}")
+            return _error_result(stderr_str)
 
-            if is_auth_error(stderr_str):
-                return CommandResult(status="error", output=f"Authentication error: {stderr_str}\nPlease check your AWS credentials.")
-
-            return CommandResult(status="error", output=stderr_str or "Command failed with no error output")
-
-        return CommandResult(status="success", output=stdout_str)
+        return CommandResult(status="success", output=decode_output(stdout))
     except asyncio.CancelledError:
         raise
     except Exception as e:
@@ -220,7 +370,7 @@ async def execute_pipe_command(pipe_command: str, timeout: int | None = None) ->
     commands = split_pipe_command(pipe_command)
     if commands:
         # Split first command by spaces to check for EC2 service specifically
-        first_cmd_parts = shlex.split(commands[0])
+        first_cmd_parts = split_command(commands[0])
         is_ec2_command = len(first_cmd_parts) >= 2 and first_cmd_parts[0] == "aws" and first_cmd_parts[1] == "ec2"
         has_region = "--region" in first_cmd_parts
 
@@ -229,9 +379,9 @@ async def execute_pipe_command(pipe_command: str, timeout: int | None = None) ->
             commands[0] = f"{commands[0]} --region {AWS_REGION}"
             # Rebuild the pipe command
             pipe_command = " | ".join(commands)
-            logger.debug(f"Added region to piped command: {pipe_command}")
+            logger.debug("Added region to piped command: %s", pipe_command)
 
-    logger.debug(f"Executing piped command: {pipe_command}")
+    logger.debug("Executing piped command: %s", pipe_command)
 
     try:
         # Execute the piped command using our tools module
@@ -244,7 +394,8 @@ async def get_command_help(service: str, command: str | None = None) -> CommandH
     """Get help documentation for an AWS CLI service or command.
 
     Retrieves the help documentation for a specified AWS service or command
-    by executing the appropriate AWS CLI help command.
+    by executing the appropriate AWS CLI help command. Successful lookups are
+    cached per AWS CLI version, so repeated requests do not spawn the CLI again.
 
     Args:
         service: The AWS service (e.g., s3, ec2)
@@ -256,6 +407,12 @@ async def get_command_help(service: str, command: str | None = None) -> CommandH
     Raises:
         CommandExecutionError: If the help command fails
     """
+    cache_key = (service, command, _aws_cli_version)
+    cached_help = _help_cache.get(cache_key)
+    if cached_help is not None:
+        _help_cache.move_to_end(cache_key)
+        return CommandHelpResult(help_text=cached_help["help_text"])
+
     # Build the help command
     cmd_parts: list[str] = ["aws", service]
     if command:
@@ -265,18 +422,23 @@ async def get_command_help(service: str, command: str | None = None) -> CommandH
     cmd_str = " ".join(cmd_parts)
 
     try:
-        logger.debug(f"Getting command help for: {cmd_str}")
+        logger.debug("Getting command help for: %s", cmd_str)
         result = await execute_aws_command(cmd_str)
 
-        help_text = result["output"] if result["status"] == "success" else f"Error: {result['output']}"
+        if result["status"] != "success":
+            return CommandHelpResult(help_text=f"Error: {result['output']}")
 
-        return CommandHelpResult(help_text=help_text)
+        help_result = CommandHelpResult(help_text=result["output"])
+        _help_cache[cache_key] = help_result
+        if len(_help_cache) > HELP_CACHE_SIZE:
+            _help_cache.popitem(last=False)
+        return CommandHelpResult(help_text=help_result["help_text"])
     except CommandValidationError as e:
-        logger.warning(f"Command validation error while getting help: {e}")
+        logger.warning("Command validation error while getting help: %s", e)
         return CommandHelpResult(help_text=f"Command validation error: {str(e)}")
     except CommandExecutionError as e:
-        logger.warning(f"Command execution error while getting help: {e}")
+        logger.warning("Command execution error while getting help: %s", e)
         return CommandHelpResult(help_text=f"Error retrieving help: {str(e)}")
     except Exception as e:
-        logger.error(f"Unexpected error while getting command help: {e}", exc_info=True)
+        logger.error("Unexpected error while getting command help: %s", e, exc_info=True)
         return CommandHelpResult(help_text=f"Error retrieving help: {str(e)}")
@@ -6,6 +6,8 @@ Environment variables:
 - AWS_MCP_TIMEOUT: Custom timeout in seconds (default: 300)
 - AWS_MCP_MAX_OUTPUT: Maximum output size in characters (default: 100000)
 - AWS_MCP_TRANSPORT: Transport protocol to use ("stdio" or "sse", default: "stdio")
+- AWS_MCP_WORKERS: Number of REST API worker processes (default: number of CPUs)
+- AWS_MCP_ACCESS_LOG: Log each REST API request ("true" or "false", default: "true")
 - AWS_PROFILE: AWS profile to use (default: "default")
 - AWS_REGION: AWS region to use (default: "us-east-1")
 - AWS_DEFAULT_REGION: Alternative to AWS_REGION (used if AWS_REGION not set)
@@ -23,6 +25,10 @@ MAX_OUTPUT_SIZE = int(os.environ.get("AWS_MCP_MAX_OUTPUT", "100000"))
 # Transport protocol
 TRANSPORT = os.environ.get("AWS_MCP_TRANSPORT", "stdio")
 
+# REST API settings
+API_WORKERS = int(os.environ.get("AWS_MCP_WORKERS", str(os.cpu_count() or 1)))
+ACCESS_LOG = os.environ.get("AWS_MCP_ACCESS_LOG", "true").lower() == "true"
+
 # AWS CLI settings
 AWS_PROFILE = os.environ.get("AWS_PROFILE", "AdministratorAccess-252628530222")
 AWS_REGION = os.environ.get("AWS_REGION", os.environ.get("AWS_DEFAULT_REGION", "us-east-1"))
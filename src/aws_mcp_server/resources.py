@@ -4,56 +4,335 @@ This module provides MCP Resources that expose AWS environment information
 including available profiles, regions, and current configuration state.
 """
 
+import asyncio
 import configparser
+import functools
 import logging
 import os
 import re
-from typing import Any, Dict, List, Optional
+import threading
+import time
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
 
-import boto3
-from botocore.exceptions import BotoCoreError, ClientError
+if TYPE_CHECKING:
+    import boto3
 
 logger = logging.getLogger(__name__)
 
+# In config file, profiles are named [profile xyz] except default
+_PROFILE_RE = re.compile(r"profile\s+(\S.*)")
+
+# Account details never change and regions change rarely, so API results are reused for hours
+ACCOUNT_INFO_CACHE_TTL = 24 * 60 * 60
+REGIONS_CACHE_TTL = 6 * 60 * 60
+_RESOURCE_CACHE: Dict[Tuple[Any, ...], Tuple[float, Any]] = {}
+
+# Human-readable descriptions for AWS region codes
+_REGION_DESCRIPTIONS: Dict[str, str] = {
+    "us-east-1": "US East (N. Virginia)",
+    "us-east-2": "US East (Ohio)",
+    "us-west-1": "US West (N. California)",
+    "us-west-2": "US West (Oregon)",
+    "af-south-1": "Africa (Cape Town)",
+    "ap-east-1": "Asia Pacific (Hong Kong)",
+    "ap-south-1": "Asia Pacific (Mumbai)",
+    "ap-northeast-1": "Asia Pacific (Tokyo)",
+    "ap-northeast-2": "Asia Pacific (Seoul)",
+    "ap-northeast-3": "Asia Pacific (Osaka)",
+    "ap-southeast-1": "Asia Pacific (Singapore)",
+    "ap-southeast-2": "Asia Pacific (Sydney)",
+    "ap-southeast-3": "Asia Pacific (Jakarta)",
+    "ca-central-1": "Canada (Central)",
+    "eu-central-1": "EU Central (Frankfurt)",
+    "eu-west-1": "EU West (Ireland)",
+    "eu-west-2": "EU West (London)",
+    "eu-west-3": "EU West (Paris)",
+    "eu-north-1": "EU North (Stockholm)",
+    "eu-south-1": "EU South (Milan)",
+    "me-south-1": "Middle East (Bahrain)",
+    "sa-east-1": "South America (São Paulo)",
+}
+
+# Static list of common regions used when the EC2 API is unavailable
+_FALLBACK_REGIONS: Tuple[Dict[str, str], ...] = (
+    {"RegionName": "us-east-1", "RegionDescription": "US East (N. Virginia)"},
+    {"RegionName": "us-east-2", "RegionDescription": "US East (Ohio)"},
+    {"RegionName": "us-west-1", "RegionDescription": "US West (N. California)"},
+    {"RegionName": "us-west-2", "RegionDescription": "US West (Oregon)"},
+    {"RegionName": "eu-west-1", "RegionDescription": "EU West (Ireland)"},
+    {"RegionName": "eu-west-2", "RegionDescription": "EU West (London)"},
+    {"RegionName": "eu-central-1", "RegionDescription": "EU Central (Frankfurt)"},
+    {"RegionName": "ap-northeast-1", "RegionDescription": "Asia Pacific (Tokyo)"},
+    {"RegionName": "ap-northeast-2", "RegionDescription": "Asia Pacific (Seoul)"},
+    {"RegionName": "ap-southeast-1", "RegionDescription": "Asia Pacific (Singapore)"},
+    {"RegionName": "ap-southeast-2", "RegionDescription": "Asia Pacific (Sydney)"},
+    {"RegionName": "sa-east-1", "RegionDescription": "South America (São Paulo)"},
+)
+
+# Prebuilt "*" runs for _mask_key, covering 20-char access keys and 40-char secret keys
+_MASK_SUFFIXES: Tuple[str, ...] = tuple("*" * length for length in range(64))
+
+# boto3 sessions are not thread-safe, so client creation from a shared session is serialized
+_SESSION_LOCK = threading.Lock()
+
+
+def _get_session_key() -> Tuple[Optional[str], str]:
+    """Get the profile and region that identify the active AWS session.
+
+    Returns:
+        Tuple of (profile name or None, region name)
+    """
+    return os.environ.get("AWS_PROFILE"), os.environ.get("AWS_REGION", os.environ.get("AWS_DEFAULT_REGION", "us-east-1"))
+
+
+def _get_credential_files_signature() -> Tuple[Tuple[str, Optional[int], Optional[int]], ...]:
+    """Build a cache key describing the AWS config and credentials files boto3 reads.
+
+    Returns:
+        File signature from _get_profile_files_signature
+    """
+    return _get_profile_files_signature(
+        [
+            os.path.expanduser(os.environ.get("AWS_CONFIG_FILE", "~/.aws/config")),
+            os.path.expanduser(os.environ.get("AWS_SHARED_CREDENTIALS_FILE", "~/.aws/credentials")),
+        ]
+    )
+
+
+@functools.lru_cache(maxsize=4)
+def _create_session(profile: Optional[str], region: Optional[str], signature: Tuple[Tuple[str, Optional[int], Optional[int]], ...]) -> "boto3.session.Session":
+    """Create a boto3 session, cached by profile, region and credential files signature.
+
+    Args:
+        profile: AWS profile name, or None for the default credential chain
+        region: AWS region name, or None to resolve it from the environment and profile
+        signature: File signature from _get_credential_files_signature
+
+    Returns:
+        Cached boto3 session
+    """
+    # boto3 is imported lazily so that starting the server does not pay for it
+    import boto3
+
+    return boto3.session.Session(profile_name=profile, region_name=region)
+
+
+@functools.lru_cache(maxsize=16)
+def _create_client(service_name: str, profile: Optional[str], region: str, signature: Tuple[Tuple[str, Optional[int], Optional[int]], ...]) -> Any:
+    """Create a boto3 client from the cached session, cached by the same key plus service.
+
+    Args:
+        service_name: AWS service name (e.g., sts, ec2)
+        profile: AWS profile name, or None for the default credential chain
+        region: AWS region name
+        signature: File signature from _get_credential_files_signature
+
+    Returns:
+        Cached boto3 client
+    """
+    session = _create_session(profile, region, signature)
+    with _SESSION_LOCK:
+        return session.client(service_name)
+
+
+def _get_session(profile: Optional[str], region: Optional[str]) -> "boto3.session.Session":
+    """Get a shared boto3 session for a profile and region.
+
+    Session construction loads botocore data and parses the AWS config files,
+    so sessions are reused until the config or credentials file changes,
+    at which point the new credentials are picked up as the AWS CLI would.
+
+    Args:
+        profile: AWS profile name, or None for the default credential chain
+        region: AWS region name, or None to resolve it from the environment and profile
+
+    Returns:
+        Cached boto3 session
+    """
+    return _create_session(profile, region, _get_credential_files_signature())
+
+
+def _get_client(service_name: str, profile: Optional[str], region: str) -> Any:
+    """Get a shared boto3 client created from the cached session.
+
+    Args:
+        service_name: AWS service name (e.g., sts, ec2)
+        profile: AWS profile name, or None for the default credential chain
+        region: AWS region name
+
+    Returns:
+        Cached boto3 client
+    """
+    return _create_client(service_name, profile, region, _get_credential_files_signature())
+
+
+def get_default_region(profile: Optional[str] = None) -> str:
+    """Get the region used when a command does not pass --region.
+
+    AWS_REGION takes precedence, as it does for the AWS CLI; otherwise the
+    session resolves AWS_DEFAULT_REGION and the profile's configured region.
+
+    Args:
+        profile: AWS profile name, or None for the active profile
+
+    Returns:
+        AWS region name, us-east-1 if none is configured
+    """
+    region = os.environ.get("AWS_REGION")
+    if region:
+        return region
+    return _get_session(profile or os.environ.get("AWS_PROFILE"), None).region_name or "us-east-1"
+
+
+def get_cached_client(service_name: str, profile: Optional[str] = None, region: Optional[str] = None) -> Any:
+    """Get a shared boto3 client, reused across calls with the same settings.
+
+    Args:
+        service_name: AWS service name (e.g., sts, ec2)
+        profile: AWS profile name, or None for the active profile
+        region: AWS region name, or None for the profile's default region
+
+    Returns:
+        Cached boto3 client
+    """
+    profile = profile or os.environ.get("AWS_PROFILE")
+    return _get_client(service_name, profile, region or get_default_region(profile))
+
+
+@functools.lru_cache(maxsize=8)
+def _read_profile_output(signature: Tuple[Tuple[str, Optional[int], Optional[int]], ...], profile: str) -> Optional[str]:
+    """Read a profile's output format from the AWS config file.
+
+    Args:
+        signature: File signature from _get_profile_files_signature
+        profile: AWS profile name
+
+    Returns:
+        Configured output format, or None if the profile does not set one
+    """
+    sections = [f"profile {profile}", "default"] if profile == "default" else [f"profile {profile}"]
+    try:
+        config = configparser.ConfigParser()
+        config.read([config_path for config_path, _, _ in signature])
+        for section in sections:
+            if config.has_option(section, "output"):
+                return config.get(section, "output")
+    except (configparser.Error, OSError, UnicodeDecodeError) as e:
+        logger.warning(f"Error reading AWS config: {e}")
+    return None
+
+
+def get_default_output(profile: Optional[str] = None) -> str:
+    """Get the output format used when a command does not pass --output.
+
+    Args:
+        profile: AWS profile name, or None for the active profile
+
+    Returns:
+        Output format name, json if none is configured
+    """
+    output = os.environ.get("AWS_DEFAULT_OUTPUT")
+    if output:
+        return output
+    profile = profile or os.environ.get("AWS_PROFILE") or "default"
+    config_path = os.path.expanduser(os.environ.get("AWS_CONFIG_FILE", "~/.aws/config"))
+    return _read_profile_output(_get_profile_files_signature([config_path]), profile) or "json"
+
+
+def _get_cached_resource(key: Tuple[Any, ...]) -> Any:
+    """Get a cached AWS API result if it has not expired.
+
+    Args:
+        key: Cache key, including the resource name and session key
+
+    Returns:
+        Cached value, or None if missing or expired
+    """
+    entry = _RESOURCE_CACHE.get(key)
+    if entry is None or time.monotonic() >= entry[0]:
+        return None
+    return entry[1]
+
+
+def _set_cached_resource(key: Tuple[Any, ...], value: Any, ttl: float) -> None:
+    """Store an AWS API result in the resource cache.
+
+    Args:
+        key: Cache key, including the resource name and session key
+        value: Value to cache
+        ttl: Time to live in seconds
+    """
+    _RESOURCE_CACHE[key] = (time.monotonic() + ttl, value)
+
+
+def _get_profile_files_signature(config_paths: List[str]) -> Tuple[Tuple[str, Optional[int], Optional[int]], ...]:
+    """Build a cache key describing the current state of the AWS profile files.
+
+    Args:
+        config_paths: Paths of the AWS config and credentials files
+
+    Returns:
+        Tuple of (path, mtime_ns, size) entries; mtime and size are None for missing files
+    """
+    signature = []
+    for config_path in config_paths:
+        try:
+            stat_result = os.stat(config_path)
+            signature.append((config_path, stat_result.st_mtime_ns, stat_result.st_size))
+        except OSError:
+            signature.append((config_path, None, None))
+    return tuple(signature)
+
+
+@functools.lru_cache(maxsize=1)
+def _read_aws_profiles(signature: Tuple[Tuple[str, Optional[int], Optional[int]], ...]) -> Tuple[str, ...]:
+    """Parse profile names from the AWS config and credentials files.
+
+    Results are cached by file signature, so the files are only re-parsed
+    when one of them is created, removed, or modified.
+
+    Args:
+        signature: File signature from _get_profile_files_signature
+
+    Returns:
+        Tuple of profile names
+    """
+    profiles = ["default"]  # default profile always exists
+    seen = {"default"}
+
+    try:
+        # Parse both files with one parser; missing files are skipped by read()
+        config = configparser.ConfigParser()
+        config.read([config_path for config_path, _, _ in signature])
+
+        for section in config.sections():
+            # In config file, profiles are named [profile xyz] except default
+            # In credentials file, profiles are named [xyz]
+            profile_match = _PROFILE_RE.match(section)
+            profile_name = profile_match.group(1) if profile_match else section
+            if profile_name not in seen:
+                seen.add(profile_name)
+                profiles.append(profile_name)
+    except (configparser.Error, OSError, UnicodeDecodeError) as e:
+        logger.warning(f"Error reading AWS profiles: {e}")
+
+    return tuple(profiles)
+
 
 def get_aws_profiles() -> List[str]:
     """Get available AWS profiles from config and credentials files.
 
     Reads the AWS config and credentials files to extract all available profiles.
+    Parsed results are reused until one of the files changes on disk.
 
     Returns:
         List of profile names
     """
-    profiles = ["default"]  # default profile always exists
     config_paths = [
         os.path.expanduser("~/.aws/config"),
         os.path.expanduser("~/.aws/credentials"),
     ]
-
-    try:
-        for config_path in config_paths:
-            if not os.path.exists(config_path):
-                continue
-
-            config = configparser.ConfigParser()
-            config.read(config_path)
-
-            for section in config.sections():
-                # In config file, profiles are named [profile xyz] except default
-                # In credentials file, profiles are named [xyz]
-                profile_match = re.match(r"profile\s+(.+)", section)
-                if profile_match:
-                    # This is from config file
-                    profile_name = profile_match.group(1)
-                    if profile_name not in profiles:
-                        profiles.append(profile_name)
-                elif section != "default" and section not in profiles:
-                    # This is likely from credentials file
-                    profiles.append(section)
-    except Exception as e:
-        logger.warning(f"Error reading AWS profiles: {e}")
-
-    return profiles
+    return list(_read_aws_profiles(_get_profile_files_signature(config_paths)))
 
 
 def get_aws_regions() -> List[Dict[str, str]]:
@@ -65,11 +344,18 @@ def get_aws_regions() -> List[Dict[str, str]]:
     Returns:
         List of region dictionaries with name and description
     """
+    from botocore.exceptions import BotoCoreError, ClientError
+
+    session_key = _get_session_key()
+    cache_key = ("regions", *session_key)
+    cached_regions = _get_cached_resource(cache_key)
+    if cached_regions is not None:
+        return [dict(region) for region in cached_regions]
+
     try:
-        # Create a session - boto3 will automatically use credentials from
+        # Reuse the shared client - boto3 will automatically use credentials from
         # environment variables if no config file is available
-        session = boto3.session.Session(region_name=os.environ.get("AWS_REGION", os.environ.get("AWS_DEFAULT_REGION", "us-east-1")))
-        ec2 = session.client("ec2")
+        ec2 = _get_client("ec2", *session_key)
         response = ec2.describe_regions()
 
         # Format the regions
@@ -77,29 +363,17 @@ def get_aws_regions() -> List[Dict[str, str]]:
         for region in response["Regions"]:
             region_name = region["RegionName"]
             # Create a friendly name based on the region code
-            description = _get_region_description(region_name)
+            description = _REGION_DESCRIPTIONS.get(region_name) or f"AWS Region {region_name}"
             regions.append({"RegionName": region_name, "RegionDescription": description})
 
         # Sort regions by name
         regions.sort(key=lambda r: r["RegionName"])
-        return regions
+        _set_cached_resource(cache_key, regions, REGIONS_CACHE_TTL)
+        return [dict(region) for region in regions]
     except (BotoCoreError, ClientError) as e:
         logger.warning(f"Error fetching AWS regions: {e}")
         # Fallback to a static list of common regions
-        return [
-            {"RegionName": "us-east-1", "RegionDescription": "US East (N. Virginia)"},
-            {"RegionName": "us-east-2", "RegionDescription": "US East (Ohio)"},
-            {"RegionName": "us-west-1", "RegionDescription": "US West (N. California)"},
-            {"RegionName": "us-west-2", "RegionDescription": "US West (Oregon)"},
-            {"RegionName": "eu-west-1", "RegionDescription": "EU West (Ireland)"},
-            {"RegionName": "eu-west-2", "RegionDescription": "EU West (London)"},
-            {"RegionName": "eu-central-1", "RegionDescription": "EU Central (Frankfurt)"},
-            {"RegionName": "ap-northeast-1", "RegionDescription": "Asia Pacific (Tokyo)"},
-            {"RegionName": "ap-northeast-2", "RegionDescription": "Asia Pacific (Seoul)"},
-            {"RegionName": "ap-southeast-1", "RegionDescription": "Asia Pacific (Singapore)"},
-            {"RegionName": "ap-southeast-2", "RegionDescription": "Asia Pacific (Sydney)"},
-            {"RegionName": "sa-east-1", "RegionDescription": "South America (São Paulo)"},
-        ]
+        return [dict(region) for region in _FALLBACK_REGIONS]
     except Exception as e:
         logger.warning(f"Unexpected error fetching AWS regions: {e}")
         return []
@@ -114,35 +388,10 @@ def _get_region_description(region_code: str) -> str:
     Returns:
         Human-readable region description
     """
-    region_map = {
-        "us-east-1": "US East (N. Virginia)",
-        "us-east-2": "US East (Ohio)",
-        "us-west-1": "US West (N. California)",
-        "us-west-2": "US West (Oregon)",
-        "af-south-1": "Africa (Cape Town)",
-        "ap-east-1": "Asia Pacific (Hong Kong)",
-        "ap-south-1": "Asia Pacific (Mumbai)",
-        "ap-northeast-1": "Asia Pacific (Tokyo)",
-        "ap-northeast-2": "Asia Pacific (Seoul)",
-        "ap-northeast-3": "Asia Pacific (Osaka)",
-        "ap-southeast-1": "Asia Pacific (Singapore)",
-        "ap-southeast-2": "Asia Pacific (Sydney)",
-        "ap-southeast-3": "Asia Pacific (Jakarta)",
-        "ca-central-1": "Canada (Central)",
-        "eu-central-1": "EU Central (Frankfurt)",
-        "eu-west-1": "EU West (Ireland)",
-        "eu-west-2": "EU West (London)",
-        "eu-west-3": "EU West (Paris)",
-        "eu-north-1": "EU North (Stockholm)",
-        "eu-south-1": "EU South (Milan)",
-        "me-south-1": "Middle East (Bahrain)",
-        "sa-east-1": "South America (São Paulo)",
-    }
+    return _REGION_DESCRIPTIONS.get(region_code) or f"AWS Region {region_code}"
 
-    return region_map.get(region_code, f"AWS Region {region_code}")
 
-
-def get_region_available_services(session: boto3.session.Session, region_code: str) -> List[Dict[str, str]]:
+def get_region_available_services(session: "boto3.session.Session", region_code: str) -> List[Dict[str, str]]:
     """Get available AWS services for a specific region.
 
     Uses the Service Quotas API to get a comprehensive list of services available
@@ -283,6 +532,8 @@ def get_region_details(region_code: str) -> Dict[str, Any]:
     Returns:
         Dictionary with region details
     """
+    import boto3
+
     region_info = {
         "code": region_code,
         "name": _get_region_description(region_code),
@@ -344,7 +595,7 @@ def get_aws_environment() -> Dict[str, str]:
 
     try:
         # Try to load credentials from the session (preferred method)
-        session = boto3.session.Session()
+        session = _get_session(*_get_session_key())
         credentials = session.get_credentials()
         if credentials:
             env_info["has_credentials"] = True
@@ -383,18 +634,80 @@ def _mask_key(key: str) -> str:
 
     # Show only first few characters
     visible_len = min(3, len(key))
-    return key[:visible_len] + "*" * (len(key) - visible_len)
+    masked_len = len(key) - visible_len
+    if masked_len < len(_MASK_SUFFIXES):
+        return key[:visible_len] + _MASK_SUFFIXES[masked_len]
+    return key[:visible_len] + "*" * masked_len
+
+
+def _get_account_alias(session_key: Tuple[Optional[str], str]) -> Optional[str]:
+    """Get the IAM alias of the current AWS account.
+
+    Args:
+        session_key: Tuple of (profile name or None, region name)
+
+    Returns:
+        The first account alias, or None if there is none or IAM access is denied
+    """
+    try:
+        iam = _get_client("iam", *session_key)
+        aliases = iam.list_account_aliases().get("AccountAliases", [])
+        if aliases:
+            return aliases[0]
+    except Exception as e:
+        logger.debug(f"Error getting account alias: {e}")
+    return None
 
 
-def get_aws_account_info() -> Dict[str, Optional[str]]:
+def _get_organization_info(session_key: Tuple[Optional[str], str], account_id: str) -> Dict[str, Optional[str]]:
+    """Get AWS Organizations details for the current account.
+
+    Args:
+        session_key: Tuple of (profile name or None, region name)
+        account_id: Account ID returned by STS
+
+    Returns:
+        Dictionary with the account info fields to update
+    """
+    org_info = {}
+    try:
+        org = _get_client("organizations", *session_key)
+        # First try to get organization info
+        try:
+            org_response = org.describe_organization()
+            if "OrganizationId" in org_response:
+                org_info["organization_id"] = org_response["OrganizationId"]
+        except Exception:
+            # Then try to get account-specific info if org-level call fails
+            account_response = org.describe_account(AccountId=account_id)
+            if "Account" in account_response and "Id" in account_response["Account"]:
+                # The account ID itself isn't the organization ID, but we might
+                # be able to extract information from other means
+                org_info["account_id"] = account_response["Account"]["Id"]
+    except Exception as e:
+        # Organizations access is often restricted, so this is expected to fail in many cases
+        logger.debug(f"Error getting organization info: {e}")
+    return org_info
+
+
+async def get_aws_account_info() -> Dict[str, Optional[str]]:
     """Get information about the current AWS account.
 
     Uses STS to retrieve account ID and alias information.
     Automatically uses credentials from environment variables if no config file is available.
+    The IAM alias and Organizations lookups only depend on the account ID,
+    so they run concurrently in worker threads once STS has answered.
 
     Returns:
         Dictionary with AWS account information
     """
+    session_key = _get_session_key()
+    # Keyed on the credential files too, so switching credentials is not answered with the old account
+    cache_key = ("account_info", *session_key, _get_credential_files_signature())
+    cached_info = _get_cached_resource(cache_key)
+    if cached_info is not None:
+        return dict(cached_info)
+
     account_info = {
         "account_id": None,
         "account_alias": None,
@@ -402,46 +715,28 @@ def get_aws_account_info() -> Dict[str, Optional[str]]:
     }
 
     try:
-        # Create a session - boto3 will automatically use credentials from
-        # environment variables if no config file is available
-        session = boto3.session.Session(region_name=os.environ.get("AWS_REGION", os.environ.get("AWS_DEFAULT_REGION", "us-east-1")))
-
-        # Get account ID from STS
-        sts = session.client("sts")
-        account_id = sts.get_caller_identity().get("Account")
+        # Get account ID from STS - the shared client will automatically use
+        # credentials from environment variables if no config file is available.
+        # The client is built in the worker thread too, as creating it can load botocore data
+        caller_identity = await asyncio.to_thread(lambda: _get_client("sts", *session_key).get_caller_identity())
+        account_id = caller_identity.get("Account")
         account_info["account_id"] = account_id
 
-        # Try to get account alias
+        # Try to get account alias and organization info
         if account_id:
-            try:
-                iam = session.client("iam")
-                aliases = iam.list_account_aliases().get("AccountAliases", [])
-                if aliases:
-                    account_info["account_alias"] = aliases[0]
-            except Exception as e:
-                logger.debug(f"Error getting account alias: {e}")
-
-            # Try to get organization info
-            try:
-                org = session.client("organizations")
-                # First try to get organization info
-                try:
-                    org_response = org.describe_organization()
-                    if "OrganizationId" in org_response:
-                        account_info["organization_id"] = org_response["OrganizationId"]
-                except Exception:
-                    # Then try to get account-specific info if org-level call fails
-                    account_response = org.describe_account(AccountId=account_id)
-                    if "Account" in account_response and "Id" in account_response["Account"]:
-                        # The account ID itself isn't the organization ID, but we might
-                        # be able to extract information from other means
-                        account_info["account_id"] = account_response["Account"]["Id"]
-            except Exception as e:
-                # Organizations access is often restricted, so this is expected to fail in many cases
-                logger.debug(f"Error getting organization info: {e}")
+            async with asyncio.TaskGroup() as task_group:
+                alias_task = task_group.create_task(asyncio.to_thread(_get_account_alias, session_key))
+                org_task = task_group.create_task(asyncio.to_thread(_get_organization_info, session_key, account_id))
+
+            account_info["account_alias"] = alias_task.result()
+            account_info.update(org_task.result())
     except Exception as e:
         logger.warning(f"Error getting AWS account info: {e}")
 
+    # Only cache successful lookups so transient credential errors are retried
+    if account_info["account_id"]:
+        _set_cached_resource(cache_key, dict(account_info), ACCOUNT_INFO_CACHE_TTL)
+
     return account_info
 
 
@@ -534,6 +829,6 @@ def register_resources(mcp):
         Returns:
             Dictionary with account information
         """
-        return get_aws_account_info()
+        return await get_aws_account_info()
 
     logger.info("Successfully registered all AWS resources")
@@ -7,8 +7,8 @@ and pipe command validation.
 
 import logging
 import re
-import shlex
 from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, List, Optional
 
@@ -16,9 +16,9 @@ import yaml
 
 from aws_mcp_server.config import SECURITY_CONFIG_PATH, SECURITY_MODE
 from aws_mcp_server.tools import (
-    is_pipe_command,
+    ALLOWED_UNIX_COMMANDS,
+    split_command,
     split_pipe_command,
-    validate_unix_command,
 )
 
 logger = logging.getLogger(__name__)
@@ -388,9 +388,9 @@ def load_security_config() -> SecurityConfig:
                                 )
                             )
 
-                logger.info(f"Loaded security configuration from {config_path}")
+                logger.info("Loaded security configuration from %s", config_path)
             except Exception as e:
-                logger.error(f"Error loading security configuration: {str(e)}")
+                logger.error("Error loading security configuration: %s", e)
                 logger.warning("Using default security configuration")
 
     return SecurityConfig(dangerous_commands=dangerous_commands, safe_patterns=safe_patterns, regex_rules=regex_rules)
@@ -400,6 +400,22 @@ def load_security_config() -> SecurityConfig:
 SECURITY_CONFIG = load_security_config()
 
 
+@lru_cache(maxsize=128)
+def _compile_prefix_pattern(prefixes: tuple[str, ...]) -> re.Pattern[str]:
+    """Compile command prefixes into one anchored alternation.
+
+    Alternatives are tried in order, so the match is the first prefix in the
+    list that the command starts with, as with a startswith loop.
+
+    Args:
+        prefixes: Command prefixes to match
+
+    Returns:
+        Compiled pattern matching any of the prefixes at the start of a command
+    """
+    return re.compile("|".join(re.escape(prefix) for prefix in prefixes))
+
+
 def is_service_command_safe(command: str, service: str) -> bool:
     """Check if a command for a specific service is safe.
 
@@ -422,14 +438,14 @@ def is_service_command_safe(command: str, service: str) -> bool:
         # Check if the command matches any safe pattern for this service
         for safe_pattern in SECURITY_CONFIG.safe_patterns[service]:
             if command.startswith(safe_pattern):
-                logger.debug(f"Command matches service-specific safe pattern: {safe_pattern}")
+                logger.debug("Command matches service-specific safe pattern: %s", safe_pattern)
                 return True
 
     # Then check general safe patterns that apply to all services
     if "general" in SECURITY_CONFIG.safe_patterns:
         for safe_pattern in SECURITY_CONFIG.safe_patterns["general"]:
             if safe_pattern in command:
-                logger.debug(f"Command matches general safe pattern: {safe_pattern}")
+                logger.debug("Command matches general safe pattern: %s", safe_pattern)
                 return True
 
     return False
@@ -450,7 +466,7 @@ def check_regex_rules(command: str, service: Optional[str] = None) -> Optional[s
         for rule in SECURITY_CONFIG.regex_rules["general"]:
             pattern = re.compile(rule.pattern)
             if pattern.search(command):
-                logger.warning(f"Command matches regex rule: {rule.description}")
+                logger.warning("Command matches regex rule: %s", rule.description)
                 return rule.error_message
 
     # Check service-specific rules if service is provided
@@ -458,7 +474,7 @@ def check_regex_rules(command: str, service: Optional[str] = None) -> Optional[s
         for rule in SECURITY_CONFIG.regex_rules[service]:
             pattern = re.compile(rule.pattern)
             if pattern.search(command):
-                logger.warning(f"Command matches service-specific regex rule for {service}: {rule.description}")
+                logger.warning("Command matches service-specific regex rule for %s: %s", service, rule.description)
                 return rule.error_message
 
     return None
@@ -473,15 +489,15 @@ def validate_aws_command(command: str) -> None:
     Raises:
         ValueError: If the command is invalid
     """
-    logger.debug(f"Validating AWS command: {command}")
+    logger.debug("Validating AWS command: %s", command)
 
     # Skip validation in permissive mode
     if SECURITY_MODE.lower() == "permissive":
-        logger.warning(f"Running in permissive security mode, skipping validation for: {command}")
+        logger.warning("Running in permissive security mode, skipping validation for: %s", command)
         return
 
     # Basic validation
-    cmd_parts = shlex.split(command)
+    cmd_parts = split_command(command)
     if not cmd_parts or cmd_parts[0].lower() != "aws":
         raise ValueError("Commands must start with 'aws'")
 
@@ -497,21 +513,22 @@ def validate_aws_command(command: str) -> None:
         raise ValueError(error_message)
 
     # Check against dangerous commands for this service
-    if service in SECURITY_CONFIG.dangerous_commands:
-        # Check each dangerous command pattern
-        for dangerous_cmd in SECURITY_CONFIG.dangerous_commands[service]:
-            if command.startswith(dangerous_cmd):
-                # If it's a dangerous command, check if it's also in safe patterns
-                if is_service_command_safe(command, service):
-                    return  # Command is safe despite matching dangerous pattern
-
-                # Command is dangerous, raise an error
-                raise ValueError(
-                    f"This command ({dangerous_cmd}) is restricted for security reasons. "
-                    f"Please use a more specific, read-only command or add 'help' or '--help' to see available options."
-                )
+    dangerous_cmds = SECURITY_CONFIG.dangerous_commands.get(service)
+    if dangerous_cmds:
+        # Match all dangerous command prefixes for this service in one pass
+        match = _compile_prefix_pattern(tuple(dangerous_cmds)).match(command)
+        if match:
+            # If it's a dangerous command, check if it's also in safe patterns
+            if is_service_command_safe(command, service):
+                return  # Command is safe despite matching dangerous pattern
+
+            # Command is dangerous, raise an error
+            raise ValueError(
+                f"This command ({match.group(0)}) is restricted for security reasons. "
+                f"Please use a more specific, read-only command or add 'help' or '--help' to see available options."
+            )
 
-    logger.debug(f"Command validation successful: {command}")
+    logger.debug("Command validation successful: %s", command)
 
 
 def validate_pipe_command(pipe_command: str) -> None:
@@ -525,11 +542,11 @@ def validate_pipe_command(pipe_command: str) -> None:
     Raises:
         ValueError: If any command in the pipe is invalid
     """
-    logger.debug(f"Validating pipe command: {pipe_command}")
+    logger.debug("Validating pipe command: %s", pipe_command)
 
     # Skip validation in permissive mode
     if SECURITY_MODE.lower() == "permissive":
-        logger.warning(f"Running in permissive security mode, skipping validation for: {pipe_command}")
+        logger.warning("Running in permissive security mode, skipping validation for: %s", pipe_command)
         return
 
     commands = split_pipe_command(pipe_command)
@@ -542,14 +559,15 @@ def validate_pipe_command(pipe_command: str) -> None:
 
     # Subsequent commands should be valid Unix commands
     for i, cmd in enumerate(commands[1:], 1):
-        cmd_parts = shlex.split(cmd)
+        cmd_parts = split_command(cmd)
         if not cmd_parts:
             raise ValueError(f"Empty command at position {i} in pipe")
 
-        if not validate_unix_command(cmd):
+        # Check the allowlist on the tokens split above instead of splitting the command again
+        if cmd_parts[0] not in ALLOWED_UNIX_COMMANDS:
             raise ValueError(f"Command '{cmd_parts[0]}' at position {i} in pipe is not allowed. Only AWS commands and basic Unix utilities are permitted.")
 
-    logger.debug(f"Pipe command validation successful: {pipe_command}")
+    logger.debug("Pipe command validation successful: %s", pipe_command)
 
 
 def reload_security_config() -> None:
@@ -584,17 +602,17 @@ def validate_command(command: str) -> None:
     Raises:
         ValueError: If the command is invalid with a descriptive error message
     """
-    logger.debug(f"Validating command: {command}")
+    logger.debug("Validating command: %s", command)
 
     # Step 1: Skip validation in permissive mode
     if SECURITY_MODE.lower() == "permissive":
-        logger.warning(f"Running in permissive security mode, skipping validation for: {command}")
+        logger.warning("Running in permissive security mode, skipping validation for: %s", command)
         return
 
     # Step 2: Determine command type and validate accordingly
-    if is_pipe_command(command):
+    if len(split_pipe_command(command)) > 1:
         validate_pipe_command(command)
     else:
         validate_aws_command(command)
 
-    logger.debug(f"Command validation successful: {command}")
+    logger.debug("Command validation successful: %s", command)
@@ -8,6 +8,7 @@ It also provides MCP Resources for AWS profiles, regions, and configuration.
 import asyncio
 import logging
 import sys
+import time
 
 from mcp.server.fastmcp import Context, FastMCP
 from pydantic import Field
@@ -30,6 +31,16 @@ from aws_mcp_server.resources import register_resources
 logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s", handlers=[logging.StreamHandler(sys.stderr)])
 logger = logging.getLogger("aws-mcp-server")
 
+# Commands whose output does not depend on AWS itself, mapped to how long (in seconds) their result is reused
+LOCAL_COMMAND_TTLS = {
+    "aws --version": 300,
+    "aws help": 300,
+    "aws configure list": 60,
+}
+
+# Successful results of LOCAL_COMMAND_TTLS commands, as (expiry time, result)
+_local_command_cache: dict[str, tuple[float, CommandResult]] = {}
+
 
 # Run startup checks in synchronous context
 def run_startup_checks():
@@ -41,9 +52,6 @@ def run_startup_checks():
     logger.info("AWS CLI is installed and available")
 
 
-# Call the checks
-# run_startup_checks()
-
 # Create the FastMCP server following FastMCP best practices
 mcp = FastMCP(
     "AWS MCP Server",
@@ -125,7 +133,17 @@ async def aws_cli_pipeline(
         await ctx.info(message + (f" with timeout: {timeout}s" if timeout else ""))
 
     try:
-        result = await execute_aws_command(command, timeout)
+        # Answer repeated local-only commands without spawning the AWS CLI again
+        cache_key = " ".join(command.split())
+        ttl = LOCAL_COMMAND_TTLS.get(cache_key)
+        cached = _local_command_cache.get(cache_key) if ttl else None
+        if cached and cached[0] > time.monotonic():
+            logger.debug("Using cached result for: %s", cache_key)
+            result = cached[1]
+        else:
+            result = await execute_aws_command(command, timeout)
+            if ttl and result["status"] == "success":
+                _local_command_cache[cache_key] = (time.monotonic() + ttl, result)
 
         # Format the output for better readability
         if result["status"] == "success":
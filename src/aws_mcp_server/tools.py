@@ -7,73 +7,94 @@ This module provides utilities for validating and executing commands, including:
 """
 
 import asyncio
+import codecs
 import logging
+import os
+import re
 import shlex
-from typing import List, TypedDict
+import signal
+from typing import FrozenSet, List, Tuple, TypedDict
 
 from aws_mcp_server.config import DEFAULT_TIMEOUT, MAX_OUTPUT_SIZE
 
 # Configure module logger
 logger = logging.getLogger(__name__)
 
-# List of allowed Unix commands that can be used in a pipe
-ALLOWED_UNIX_COMMANDS = [
-    # File operations
-    "cat",
-    "ls",
-    "cd",
-    "pwd",
-    "cp",
-    "mv",
-    "rm",
-    "mkdir",
-    "touch",
-    "chmod",
-    "chown",
-    # Text processing
-    "grep",
-    "sed",
-    "awk",
-    "cut",
-    "sort",
-    "uniq",
-    "wc",
-    "head",
-    "tail",
-    "tr",
-    "find",
-    # System information
-    "ps",
-    "top",
-    "df",
-    "du",
-    "uname",
-    "whoami",
-    "date",
-    "which",
-    "echo",
-    # Networking
-    "ping",
-    "ifconfig",
-    "netstat",
-    "curl",
-    "wget",
-    "dig",
-    "nslookup",
-    "ssh",
-    "scp",
-    # Other utilities
-    "man",
-    "less",
-    "tar",
-    "gzip",
-    "gunzip",
-    "zip",
-    "unzip",
-    "xargs",
-    "jq",
-    "tee",
-]
+# Set of allowed Unix commands that can be used in a pipe
+ALLOWED_UNIX_COMMANDS: FrozenSet[str] = frozenset(
+    {
+        # File operations
+        "cat",
+        "ls",
+        "cd",
+        "pwd",
+        "cp",
+        "mv",
+        "rm",
+        "mkdir",
+        "touch",
+        "chmod",
+        "chown",
+        # Text processing
+        "grep",
+        "sed",
+        "awk",
+        "cut",
+        "sort",
+        "uniq",
+        "wc",
+        "head",
+        "tail",
+        "tr",
+        "find",
+        # System information
+        "ps",
+        "top",
+        "df",
+        "du",
+        "uname",
+        "whoami",
+        "date",
+        "which",
+        "echo",
+        # Networking
+        "ping",
+        "ifconfig",
+        "netstat",
+        "curl",
+        "wget",
+        "dig",
+        "nslookup",
+        "ssh",
+        "scp",
+        # Other utilities
+        "man",
+        "less",
+        "tar",
+        "gzip",
+        "gunzip",
+        "zip",
+        "unzip",
+        "xargs",
+        "jq",
+        "tee",
+    }
+)
+
+
+# Subprocess output is read in chunks of this size
+STREAM_CHUNK_SIZE = 64 * 1024
+
+# UTF-8 characters take at most 4 bytes, so reading past this many bytes always
+# yields more than MAX_OUTPUT_SIZE characters and the rest of the output can be dropped
+MAX_OUTPUT_BYTES = 4 * MAX_OUTPUT_SIZE
+
+# Return code of a pipe stage killed by SIGPIPE after the next command stopped reading (POSIX only)
+_SIGPIPE_RETURNCODE = -signal.SIGPIPE if hasattr(signal, "SIGPIPE") else None
+
+# Characters that make shlex.split differ from str.split on ASCII input: quotes,
+# escapes, and whitespace that str.split treats as a separator but shlex does not
+_SHLEX_SPECIAL_RE = re.compile(r"[\"'\\\x0b\x0c\x1c-\x1f]")
 
 
 class CommandResult(TypedDict):
@@ -83,6 +104,26 @@ class CommandResult(TypedDict):
     output: str
 
 
+def split_command(command: str) -> List[str]:
+    """Split a command into arguments using shell-like syntax.
+
+    Most commands contain no quotes or escapes, so these are split with
+    str.split and only the rest go through the slower shlex tokenizer.
+
+    Args:
+        command: The command to split
+
+    Returns:
+        List of command arguments
+
+    Raises:
+        ValueError: If the command has unbalanced quotes or a trailing escape
+    """
+    if command.isascii() and not _SHLEX_SPECIAL_RE.search(command):
+        return command.split()
+    return shlex.split(command)
+
+
 def validate_unix_command(command: str) -> bool:
     """Validate that a command is an allowed Unix command.
 
@@ -92,7 +133,7 @@ def validate_unix_command(command: str) -> bool:
     Returns:
         True if the command is valid, False otherwise
     """
-    cmd_parts = shlex.split(command)
+    cmd_parts = split_command(command)
     if not cmd_parts:
         return False
 
@@ -100,82 +141,225 @@ def validate_unix_command(command: str) -> bool:
     return cmd_parts[0] in ALLOWED_UNIX_COMMANDS
 
 
-def is_pipe_command(command: str) -> bool:
-    """Check if a command contains a pipe operator.
+def decode_output(data: bytes, limit: int = MAX_OUTPUT_SIZE) -> str:
+    """Decode command output, truncating it to at most limit characters.
+
+    Only the bytes needed for the first limit characters are decoded, so large
+    outputs that are mostly discarded are not converted to a string in full.
 
     Args:
-        command: The command to check
+        data: Raw output of the command
+        limit: Maximum number of characters to keep
 
     Returns:
-        True if the command contains a pipe operator, False otherwise
+        Decoded output, with a truncation notice appended if it was cut short
     """
-    # Check for pipe operator that's not inside quotes
-    in_single_quote = False
-    in_double_quote = False
-    escaped = False
+    # Every byte decodes to at most one character, so short outputs cannot need truncating
+    if len(data) <= limit:
+        return data.decode("utf-8", errors="replace")
+
+    decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+    text = decoder.decode(data[:limit])
+    consumed = limit
+    # Multi-byte characters yield fewer characters than bytes, so keep decoding until the limit is reached
+    while len(text) < limit and consumed < len(data):
+        step = limit - len(text)
+        text += decoder.decode(data[consumed : consumed + step])
+        consumed += step
+    if consumed >= len(data):
+        text += decoder.decode(b"", final=True)
+        if len(text) <= limit:
+            return text
+
+    logger.info("Output truncated from %s bytes to %s characters", len(data), limit)
+    return text[:limit] + "\n... (output truncated)"
+
+
+async def _read_stream(stream: asyncio.StreamReader | None, limit: int) -> Tuple[bytes, bool]:
+    """Read a subprocess stream until EOF or until more than limit bytes have been read.
 
-    for _, char in enumerate(command):
-        # Handle escape sequences
-        if char == "\\" and not escaped:
-            escaped = True
-            continue
+    Args:
+        stream: The stream to read, or None if it was not redirected to a pipe
+        limit: Number of bytes after which reading stops
 
-        if not escaped:
-            if char == "'" and not in_double_quote:
-                in_single_quote = not in_single_quote
-            elif char == '"' and not in_single_quote:
-                in_double_quote = not in_double_quote
-            elif char == "|" and not in_single_quote and not in_double_quote:
-                return True
+    Returns:
+        Tuple of (data read, whether reading stopped before EOF)
+    """
+    if stream is None:
+        return b"", False
 
-        escaped = False
+    buffer = bytearray()
+    while len(buffer) <= limit:
+        chunk = await stream.read(STREAM_CHUNK_SIZE)
+        if not chunk:
+            return bytes(buffer), False
+        buffer.extend(chunk)
+    return bytes(buffer), True
 
-    return False
+
+async def communicate_with_limit(process: asyncio.subprocess.Process, input: bytes | None = None, limit: int = MAX_OUTPUT_BYTES) -> Tuple[bytes, bytes, bool]:
+    """Interact with a process like Process.communicate, with bounded memory.
+
+    stdout and stderr are read concurrently while input is written to stdin.
+    Once more than limit bytes have been read from either stream, the process
+    is killed instead of buffering the rest of its output.
+
+    Args:
+        process: The process to interact with
+        input: Optional data to send to the process's stdin
+        limit: Number of bytes per stream after which the process is killed
+
+    Returns:
+        Tuple of (stdout, stderr, whether stdout was cut short)
+    """
+
+    async def feed_stdin() -> None:
+        if process.stdin is None:
+            return
+        try:
+            if input:
+                process.stdin.write(input)
+                await process.stdin.drain()
+        except (BrokenPipeError, ConnectionResetError):
+            # The process exited or was killed before reading all of its input
+            pass
+        finally:
+            process.stdin.close()
+
+    async def read_output(stream: asyncio.StreamReader | None) -> Tuple[bytes, bool]:
+        data, truncated = await _read_stream(stream, limit)
+        if truncated:
+            # Stop the process rather than leaving it blocked on a full pipe
+            logger.info("Output exceeded %s bytes, stopping the command", limit)
+            try:
+                process.kill()
+            except ProcessLookupError:
+                pass
+        return data, truncated
+
+    (stdout, truncated), (stderr, _), _ = await asyncio.gather(read_output(process.stdout), read_output(process.stderr), feed_stdin())
+    await process.wait()
+    return stdout, stderr, truncated
 
 
 def split_pipe_command(pipe_command: str) -> List[str]:
     """Split a piped command into individual commands.
 
+    Pipe operators inside single or double quotes, or escaped with a backslash,
+    do not split the command. A command without a pipe is returned as a single
+    element list, so callers can detect pipes with ``len(commands) > 1``.
+
     Args:
         pipe_command: The piped command string
 
     Returns:
         List of individual command strings
     """
+    # Fast path: without a pipe character there is nothing to split
+    if "|" not in pipe_command:
+        command = pipe_command.strip()
+        return [command] if command else []
+
     commands = []
-    current_command = ""
+    start = 0
     in_single_quote = False
     in_double_quote = False
     escaped = False
 
-    for _, char in enumerate(pipe_command):
-        # Handle escape sequences
-        if char == "\\" and not escaped:
+    for index, char in enumerate(pipe_command):
+        if escaped:
+            escaped = False
+        elif char == "\\":
             escaped = True
-            current_command += char
-            continue
-
-        if not escaped:
-            if char == "'" and not in_double_quote:
-                in_single_quote = not in_single_quote
-                current_command += char
-            elif char == '"' and not in_single_quote:
-                in_double_quote = not in_double_quote
-                current_command += char
-            elif char == "|" and not in_single_quote and not in_double_quote:
-                commands.append(current_command.strip())
-                current_command = ""
+        elif char == "'" and not in_double_quote:
+            in_single_quote = not in_single_quote
+        elif char == '"' and not in_single_quote:
+            in_double_quote = not in_double_quote
+        elif char == "|" and not in_single_quote and not in_double_quote:
+            commands.append(pipe_command[start:index].strip())
+            start = index + 1
+
+    last_command = pipe_command[start:].strip()
+    if last_command:
+        commands.append(last_command)
+
+    return commands
+
+
+async def _start_pipeline(command_parts_list: List[List[str]]) -> List[asyncio.subprocess.Process]:
+    """Start every command of a pipeline, connecting them with OS pipes.
+
+    Each command writes straight into the next command's stdin, so the stages
+    run concurrently and intermediate output never passes through Python.
+    Only the last command's stdout, and every command's stderr, are piped back.
+
+    Args:
+        command_parts_list: Argument lists of the commands in the pipeline
+
+    Returns:
+        The started processes, in pipeline order
+    """
+    processes = []
+    stdin = None
+    try:
+        for index, cmd_parts in enumerate(command_parts_list):
+            if index == len(command_parts_list) - 1:
+                read_fd, stdout = None, asyncio.subprocess.PIPE
             else:
-                current_command += char
-        else:
-            # Add the escaped character
-            current_command += char
-            escaped = False
+                read_fd, stdout = os.pipe()
+
+            try:
+                process = await asyncio.create_subprocess_exec(*cmd_parts, stdin=stdin, stdout=stdout, stderr=asyncio.subprocess.PIPE)
+            except BaseException:
+                if read_fd is not None:
+                    os.close(read_fd)
+                raise
+            finally:
+                # The child processes hold their own copies of the pipe ends
+                if stdin is not None:
+                    os.close(stdin)
+                if read_fd is not None:
+                    os.close(stdout)
 
-    if current_command.strip():
-        commands.append(current_command.strip())
+            processes.append(process)
+            stdin = read_fd
+    except BaseException:
+        _kill_processes(processes)
+        raise
 
-    return commands
+    return processes
+
+
+def _is_broken_pipe(returncode: int | None, stderr: bytes) -> bool:
+    """Check whether a pipe stage stopped because its reader went away.
+
+    Native tools are killed by SIGPIPE, while Python programs such as the
+    AWS CLI ignore the signal and report the broken pipe on stderr instead.
+
+    Args:
+        returncode: Return code of the stage
+        stderr: Error output of the stage
+
+    Returns:
+        True if the stage failed because of a broken pipe, False otherwise
+    """
+    return (_SIGPIPE_RETURNCODE is not None and returncode == _SIGPIPE_RETURNCODE) or b"Broken pipe" in stderr
+
+
+def _kill_processes(processes: List[asyncio.subprocess.Process]) -> None:
+    """Kill every process of a pipeline, logging any failure.
+
+    Args:
+        processes: The processes to kill
+    """
+    for process in processes:
+        try:
+            # process.kill() is synchronous, not a coroutine
+            process.kill()
+        except ProcessLookupError:
+            pass
+        except Exception as e:
+            logger.error("Error killing process: %s", e)
 
 
 async def execute_piped_command(pipe_command: str, timeout: int | None = None) -> CommandResult:
@@ -192,87 +376,48 @@ async def execute_piped_command(pipe_command: str, timeout: int | None = None) -
     if timeout is None:
         timeout = DEFAULT_TIMEOUT
 
-    logger.debug(f"Executing piped command: {pipe_command}")
+    logger.debug("Executing piped command: %s", pipe_command)
 
     try:
         # Split the pipe_command into individual commands
         commands = split_pipe_command(pipe_command)
 
-        # For each command, split it into command parts for subprocess_exec
-        command_parts_list = [shlex.split(cmd) for cmd in commands]
-
         if len(commands) == 0:
             return CommandResult(status="error", output="Empty command")
 
-        # Execute the first command
-        first_cmd = command_parts_list[0]
-        first_process = await asyncio.create_subprocess_exec(*first_cmd, stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE)
-
-        current_process = first_process
-        current_stdout = None
-        current_stderr = None
-
-        # For each additional command in the pipe, execute it with the previous command's output
-        for cmd_parts in command_parts_list[1:]:
-            try:
-                # Wait for the previous command to complete with timeout
-                current_stdout, current_stderr = await asyncio.wait_for(current_process.communicate(), timeout)
-
-                if current_process.returncode != 0:
-                    # If previous command failed, stop the pipe execution
-                    stderr_str = current_stderr.decode("utf-8", errors="replace")
-                    logger.warning(f"Piped command failed with return code {current_process.returncode}: {pipe_command}")
-                    logger.debug(f"Command error output: {stderr_str}")
-                    return CommandResult(status="error", output=stderr_str or "Command failed with no error output")
-
-                # Create the next process with the previous output as input
-                next_process = await asyncio.create_subprocess_exec(
-                    *cmd_parts, stdin=asyncio.subprocess.PIPE, stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE
-                )
-
-                # Pass the output of the previous command to the input of the next command
-                stdout, stderr = await asyncio.wait_for(next_process.communicate(input=current_stdout), timeout)
-
-                current_process = next_process
-                current_stdout = stdout
-                current_stderr = stderr
-
-            except asyncio.TimeoutError:
-                logger.warning(f"Piped command timed out after {timeout} seconds: {pipe_command}")
-                try:
-                    # process.kill() is synchronous, not a coroutine
-                    current_process.kill()
-                except Exception as e:
-                    logger.error(f"Error killing process: {e}")
-                return CommandResult(status="error", output=f"Command timed out after {timeout} seconds")
-
-        # Wait for the final command to complete if it hasn't already
-        if current_stdout is None:
-            try:
-                current_stdout, current_stderr = await asyncio.wait_for(current_process.communicate(), timeout)
-            except asyncio.TimeoutError:
-                logger.warning(f"Piped command timed out after {timeout} seconds: {pipe_command}")
-                try:
-                    current_process.kill()
-                except Exception as e:
-                    logger.error(f"Error killing process: {e}")
-                return CommandResult(status="error", output=f"Command timed out after {timeout} seconds")
-
-        # Process output
-        stdout_str = current_stdout.decode("utf-8", errors="replace")
-        stderr_str = current_stderr.decode("utf-8", errors="replace")
-
-        # Truncate output if necessary
-        if len(stdout_str) > MAX_OUTPUT_SIZE:
-            logger.info(f"Output truncated from {len(stdout_str)} to {MAX_OUTPUT_SIZE} characters")
-            stdout_str = stdout_str[:MAX_OUTPUT_SIZE] + "\n... (output truncated)"
-
-        if current_process.returncode != 0:
-            logger.warning(f"Piped command failed with return code {current_process.returncode}: {pipe_command}")
-            logger.debug(f"Command error output: {stderr_str}")
+        # For each command, split it into command parts for subprocess_exec
+        command_parts_list = [split_command(cmd) for cmd in commands]
+
+        processes = await _start_pipeline(command_parts_list)
+
+        # Collect stderr from every stage and the output of the last one, waiting for all of them to exit
+        try:
+            results = await asyncio.wait_for(asyncio.gather(*(communicate_with_limit(process) for process in processes)), timeout)
+        except asyncio.TimeoutError:
+            logger.warning("Piped command timed out after %s seconds: %s", timeout, pipe_command)
+            _kill_processes(processes)
+            return CommandResult(status="error", output=f"Command timed out after {timeout} seconds")
+
+        # Report the first stage that failed, ignoring stages that only stopped
+        # because a later command (e.g. head) exited without reading all of their output
+        for process, (_, stage_stderr, _) in zip(processes[:-1], results[:-1], strict=True):
+            if process.returncode != 0 and not _is_broken_pipe(process.returncode, stage_stderr):
+                stderr_str = decode_output(stage_stderr)
+                logger.warning("Piped command failed with return code %s: %s", process.returncode, pipe_command)
+                logger.debug("Command error output: %s", stderr_str)
+                return CommandResult(status="error", output=stderr_str or "Command failed with no error output")
+
+        last_process = processes[-1]
+        stdout, stderr, truncated = results[-1]
+
+        # A process stopped for producing too much output is not a failure
+        if last_process.returncode != 0 and not truncated:
+            stderr_str = decode_output(stderr)
+            logger.warning("Piped command failed with return code %s: %s", last_process.returncode, pipe_command)
+            logger.debug("Command error output: %s", stderr_str)
             return CommandResult(status="error", output=stderr_str or "Command failed with no error output")
 
-        return CommandResult(status="success", output=stdout_str)
+        return CommandResult(status="success", output=decode_output(stdout))
     except Exception as e:
-        logger.error(f"Failed to execute piped command: {str(e)}")
+        logger.error("Failed to execute piped command: %s", e)
         return CommandResult(status="error", output=f"Failed to execute command: {str(e)}")
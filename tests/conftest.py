@@ -3,6 +3,7 @@
 import os
 
 import pytest
+import pytest_asyncio
 
 
 def pytest_addoption(parser):
@@ -39,18 +40,57 @@ def pytest_collection_modifyitems(config, items):
             item.add_marker(skip_integration)
 
 
-@pytest.fixture(scope="function")
-async def aws_s3_bucket(ensure_aws_credentials):
+async def _wait_for_bucket(s3_client, bucket_name, max_wait=5.0):
+    """Poll head_bucket with exponential backoff until the bucket is available.
+
+    Args:
+        s3_client: boto3 S3 client
+        bucket_name: Name of the bucket to wait for
+        max_wait: Maximum number of seconds to wait before giving up
+    """
+    import asyncio
+
+    from botocore.exceptions import ClientError
+
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + max_wait
+    delay = 0.1
+    while True:
+        try:
+            await asyncio.to_thread(s3_client.head_bucket, Bucket=bucket_name)
+            return
+        except ClientError as e:
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                print(f"Bucket {bucket_name} not available after {max_wait}s: {e}")
+                return
+        await asyncio.sleep(min(delay, remaining))
+        delay *= 2
+
+
+@pytest.fixture(scope="session")
+def aws_session(ensure_aws_credentials):
+    """Shared boto3 session for test setup and teardown.
+
+    Fixtures that only need AWS resources to exist use this instead of the
+    AWS CLI, avoiding a CLI process start per call. Tests that exercise the
+    CLI wrapper itself should keep calling aws_cli_pipeline.
+    """
+    import boto3
+
+    region = os.environ.get("AWS_TEST_REGION", os.environ.get("AWS_REGION", "us-east-1"))
+    return boto3.session.Session(region_name=region)
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def aws_s3_bucket(aws_session):
     """Create or use an S3 bucket for integration tests.
 
     Uses AWS_TEST_BUCKET if specified, otherwise creates a temporary bucket
-    and cleans it up after tests complete.
+    and cleans it up after tests complete. The bucket is shared by the whole
+    test session, so tests should not assume an empty bucket.
     """
     import asyncio
-    import time
-    import uuid
-
-    from aws_mcp_server.server import aws_cli_pipeline
 
     print("AWS S3 bucket fixture called")
 
@@ -59,29 +99,29 @@ async def aws_s3_bucket(ensure_aws_credentials):
     bucket_created = False
 
     # Get region from environment or use configured default
-    region = os.environ.get("AWS_TEST_REGION", os.environ.get("AWS_REGION", "us-east-1"))
+    region = aws_session.region_name
     print(f"Using AWS region: {region}")
+    s3 = aws_session.resource("s3")
 
     print(f"Using bucket name: {bucket_name or 'Will create dynamic bucket'}")
 
     if not bucket_name:
-        # Generate a unique bucket name with timestamp and random id
-        timestamp = int(time.time())
-        random_id = str(uuid.uuid4())[:8]
-        bucket_name = f"aws-mcp-test-{timestamp}-{random_id}"
+        # Generate a unique bucket name with a random suffix
+        bucket_name = f"aws-mcp-test-{os.urandom(6).hex()}"
         print(f"Generated bucket name: {bucket_name}")
 
-        # Create the bucket with region specified
-        create_cmd = f"aws s3 mb s3://{bucket_name} --region {region}"
-        print(f"Creating bucket with command: {create_cmd}")
-        result = await aws_cli_pipeline(command=create_cmd, timeout=None, ctx=None)
-        if result["status"] != "success":
-            print(f"Failed to create bucket: {result['output']}")
-            pytest.skip(f"Failed to create test bucket: {result['output']}")
+        # Create the bucket in the test region (us-east-1 rejects an explicit location constraint)
+        create_args = {} if region == "us-east-1" else {"CreateBucketConfiguration": {"LocationConstraint": region}}
+        print(f"Creating bucket: {bucket_name}")
+        try:
+            await asyncio.to_thread(s3.create_bucket, Bucket=bucket_name, **create_args)
+        except Exception as e:
+            print(f"Failed to create bucket: {e}")
+            pytest.skip(f"Failed to create test bucket: {e}")
         bucket_created = True
         print("Bucket created successfully")
-        # Wait a moment for bucket to be fully available
-        await asyncio.sleep(3)
+        # Wait for the bucket to be fully available
+        await _wait_for_bucket(s3.meta.client, bucket_name)
 
     # Yield the bucket name for tests to use
     print(f"Yielding bucket name: {bucket_name}")
@@ -91,33 +131,70 @@ async def aws_s3_bucket(ensure_aws_credentials):
     if bucket_created:
         print(f"Cleaning up bucket: {bucket_name}")
         try:
-            # First remove all objects
-            print("Removing objects from bucket")
-            await aws_cli_pipeline(command=f"aws s3 rm s3://{bucket_name} --recursive --region {region}", timeout=None, ctx=None)
-            # Then delete the bucket
-            print("Deleting bucket")
-            await aws_cli_pipeline(command=f"aws s3 rb s3://{bucket_name} --region {region}", timeout=None, ctx=None)
+            # Objects are deleted in batches of up to 1000 before the now empty bucket
+            print("Deleting bucket and its objects")
+            bucket = s3.Bucket(bucket_name)
+            await asyncio.to_thread(bucket.objects.all().delete)
+            await asyncio.to_thread(bucket.delete)
             print("Bucket cleanup complete")
         except Exception as e:
             print(f"Warning: Error cleaning up test bucket: {e}")
 
 
-@pytest.fixture
-def ensure_aws_credentials():
-    """Ensure AWS credentials are configured and AWS CLI is installed."""
-    import subprocess
+@pytest.fixture(scope="session")
+def aws_cli_available():
+    """Check once per test session whether the AWS CLI is on PATH.
+
+    Looks the executable up with shutil.which rather than running
+    `aws --version`, which would pay the full CLI startup cost.
+
+    Returns:
+        True if the aws executable is found, False otherwise
+    """
+    import shutil
+
+    aws_path = shutil.which("aws")
+    print(f"AWS CLI check: {aws_path or 'not found'}")
+    return aws_path is not None
 
+
+@pytest.fixture(scope="session")
+def aws_caller_identity():
+    """Look up the caller identity once per test session.
+
+    The lookup calls STS through boto3, which resolves credentials the same
+    way as the AWS CLI without starting a CLI process.
+
+    Returns:
+        The get-caller-identity response, or None if credentials are not usable
+    """
+    import boto3
+    from botocore.config import Config
+    from botocore.exceptions import BotoCoreError, ClientError
+
+    region = os.environ.get("AWS_TEST_REGION", os.environ.get("AWS_REGION", "us-east-1"))
+    probe_config = Config(connect_timeout=5, read_timeout=5, retries={"max_attempts": 1})
+    try:
+        identity = boto3.client("sts", region_name=region, config=probe_config).get_caller_identity()
+    except (BotoCoreError, ClientError) as e:
+        print(f"AWS auth failed: {e}")
+        return None
+
+    print(f"AWS identity: {identity['Arn']}")
+    return identity
+
+
+@pytest.fixture(scope="session")
+def ensure_aws_credentials(aws_cli_available, aws_caller_identity):
+    """Ensure AWS credentials are configured and AWS CLI is installed.
+
+    Session-scoped so credentials are probed once per test run; pytest caches
+    a skip raised here and applies it to every test that requests the fixture.
+    """
     print("Checking AWS credentials and CLI")
 
     # Check for AWS CLI installation
-    try:
-        result = subprocess.run(["aws", "--version"], stdout=subprocess.PIPE, stderr=subprocess.PIPE, check=False)
-        print(f"AWS CLI check: {result.returncode == 0}")
-        if result.returncode != 0:
-            print(f"AWS CLI not found: {result.stderr.decode('utf-8')}")
-            pytest.skip("AWS CLI not installed or not in PATH")
-    except (subprocess.SubprocessError, FileNotFoundError) as e:
-        print(f"AWS CLI check error: {str(e)}")
+    if not aws_cli_available:
         pytest.skip("AWS CLI not installed or not in PATH")
 
     # Check for AWS credentials - simplified check
@@ -130,20 +207,37 @@ def ensure_aws_credentials():
     print(f"AWS files: credentials={has_creds}, config={has_config}")
     # Don't skip based on file presence - let the get-caller-identity check decide
 
-    # Verify AWS credentials work by making a simple call
-    try:
-        result = subprocess.run(["aws", "sts", "get-caller-identity"], stdout=subprocess.PIPE, stderr=subprocess.PIPE, timeout=5, check=False)
-        print(f"AWS auth check: {result.returncode == 0}")
-        if result.returncode != 0:
-            error_msg = result.stderr.decode("utf-8")
-            print(f"AWS auth failed: {error_msg}")
-            pytest.skip(f"AWS credentials not valid: {error_msg}")
-        else:
-            print(f"AWS identity: {result.stdout.decode('utf-8')}")
-    except subprocess.SubprocessError as e:
-        print(f"AWS auth check error: {str(e)}")
-        pytest.skip("Failed to verify AWS credentials")
+    # Verify AWS credentials work
+    if aws_caller_identity is None:
+        pytest.skip("AWS credentials not valid")
 
     # All checks passed - AWS CLI and credentials are working
     print("AWS credentials verification successful")
     return True
+
+
+@pytest.fixture
+def make_process():
+    """Build mock subprocesses whose stdout and stderr can be read like real pipes.
+
+    Returns:
+        Factory taking (returncode, stdout, stderr) and returning the mock process
+    """
+    import asyncio
+    from unittest.mock import AsyncMock, MagicMock
+
+    def _make_process(returncode=0, stdout=b"", stderr=b""):
+        process = MagicMock()
+        process.returncode = returncode
+        process.stdin = None
+        process.stdout = asyncio.StreamReader()
+        process.stdout.feed_data(stdout)
+        process.stdout.feed_eof()
+        process.stderr = asyncio.StreamReader()
+        process.stderr.feed_data(stderr)
+        process.stderr.feed_eof()
+        process.communicate = AsyncMock(return_value=(stdout, stderr))
+        process.wait = AsyncMock(return_value=returncode)
+        return process
+
+    return _make_process
@@ -0,0 +1,11 @@
+"""Configuration for integration tests."""
+
+import logging
+
+import pytest
+
+
+@pytest.fixture(autouse=True, scope="session")
+def _configure_logging():
+    """Configure logging once for the integration test session."""
+    logging.basicConfig(level=logging.INFO)
@@ -4,29 +4,74 @@ These tests use mocks rather than actual AWS CLI calls, so they can
 run without AWS credentials or AWS CLI installed.
 """
 
-import json
-import logging
-import os
-from unittest.mock import patch
+import asyncio
+from unittest.mock import AsyncMock, call, patch
 
+import orjson
 import pytest
 
 from aws_mcp_server.server import aws_cli_help, aws_cli_pipeline, mcp
 
-# Enable debug logging for tests
-logging.basicConfig(level=logging.DEBUG)
-
-
-@pytest.fixture
+# Mocked JSON output of an S3 bucket listing
+S3_LS_JSON_OUTPUT = orjson.dumps({"Buckets": [{"Name": "test-bucket", "CreationDate": "2023-01-01T00:00:00Z"}]}).decode()
+
+# aws_cli_help scenarios as (service, command, mock_response, expected_content)
+HELP_SCENARIOS = (
+    # Basic service help
+    ("s3", None, {"help_text": "AWS S3 HELP\nCommands:\ncp\nls\nmv\nrm\nsync"}, ("AWS S3 HELP", "Commands", "ls", "sync")),
+    # Command-specific help
+    (
+        "ec2",
+        "describe-instances",
+        {"help_text": "DESCRIPTION\n  Describes the specified instances.\n\nSYNOPSIS\n  describe-instances\n  [--instance-ids <value>]"},
+        ("DESCRIPTION", "SYNOPSIS", "instance-ids"),
+    ),
+    # Help for a different service
+    ("lambda", "list-functions", {"help_text": "LAMBDA LIST-FUNCTIONS\nLists your Lambda functions"}, ("LAMBDA", "LIST-FUNCTIONS", "Lists")),
+)
+
+# aws_cli_pipeline scenarios as (command, mock_response, expected_result, timeout)
+PIPELINE_SCENARIOS = (
+    # JSON output test
+    (
+        "aws s3 ls --output json",
+        {"status": "success", "output": S3_LS_JSON_OUTPUT},
+        {"status": "success", "contains": ("Buckets", "test-bucket")},
+        None,
+    ),
+    # Text output test
+    (
+        "aws ec2 describe-instances --query 'Reservations[*]' --output text",
+        {"status": "success", "output": "i-12345\trunning\tt2.micro"},
+        {"status": "success", "contains": ("i-12345", "running")},
+        None,
+    ),
+    # Test with custom timeout
+    ("aws rds describe-db-instances", {"status": "success", "output": "DB instances list"}, {"status": "success", "contains": ("DB instances",)}, 60),
+    # Error case
+    (
+        "aws s3 ls --invalid-flag",
+        {"status": "error", "output": "Unknown options: --invalid-flag"},
+        {"status": "error", "contains": ("--invalid-flag",)},
+        None,
+    ),
+    # Piped command
+    (
+        "aws s3api list-buckets --query 'Buckets[*].Name' --output text | sort",
+        {"status": "success", "output": "bucket1\nbucket2\nbucket3"},
+        {"status": "success", "contains": ("bucket1", "bucket3")},
+        None,
+    ),
+)
+
+
+@pytest.fixture(scope="module")
 def mock_aws_environment():
-    """Set up mock AWS environment variables for testing."""
-    original_env = os.environ.copy()
-    os.environ["AWS_PROFILE"] = "test-profile"
-    os.environ["AWS_REGION"] = "us-west-2"
-    yield
-    # Restore original environment
-    os.environ.clear()
-    os.environ.update(original_env)
+    """Set up mock AWS environment variables once for the tests in this module."""
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setenv("AWS_PROFILE", "test-profile")
+        mp.setenv("AWS_REGION", "us-west-2")
+        yield
 
 
 @pytest.fixture
@@ -42,96 +87,75 @@ class TestServerIntegration:
     more of the system together than unit tests. They don't require the
     integration marker since they can run without AWS CLI or credentials."""
 
-    @pytest.mark.asyncio
-    @pytest.mark.parametrize(
-        "service,command,mock_response,expected_content",
-        [
-            # Basic service help
-            ("s3", None, {"help_text": "AWS S3 HELP\nCommands:\ncp\nls\nmv\nrm\nsync"}, ["AWS S3 HELP", "Commands", "ls", "sync"]),
-            # Command-specific help
-            (
-                "ec2",
-                "describe-instances",
-                {"help_text": "DESCRIPTION\n  Describes the specified instances.\n\nSYNOPSIS\n  describe-instances\n  [--instance-ids <value>]"},
-                ["DESCRIPTION", "SYNOPSIS", "instance-ids"],
-            ),
-            # Help for a different service
-            ("lambda", "list-functions", {"help_text": "LAMBDA LIST-FUNCTIONS\nLists your Lambda functions"}, ["LAMBDA", "LIST-FUNCTIONS", "Lists"]),
-        ],
-    )
-    @patch("aws_mcp_server.server.get_command_help")
-    async def test_aws_cli_help_integration(self, mock_get_help, mock_aws_environment, service, command, mock_response, expected_content):
+    @pytest.mark.parametrize("service,command,mock_response,expected_content", HELP_SCENARIOS)
+    async def test_aws_cli_help_integration(self, mock_aws_environment, service, command, mock_response, expected_content):
         """Test the aws_cli_help functionality with table-driven tests."""
-        # Configure the mock response
-        mock_get_help.return_value = mock_response
+        with patch("aws_mcp_server.server.get_command_help", new_callable=AsyncMock) as mock_get_help:
+            # Configure the mock response
+            mock_get_help.return_value = mock_response
 
-        # Call the aws_cli_help function
-        result = await aws_cli_help(service=service, command=command, ctx=None)
+            # Call the aws_cli_help function
+            result = await aws_cli_help(service=service, command=command, ctx=None)
 
-        # Verify the results
+        # Verify the result
         assert "help_text" in result
+        help_text = result["help_text"]
         for content in expected_content:
-            assert content in result["help_text"], f"Expected '{content}' in help text"
+            assert content in help_text, f"Expected '{content}' in help text"
 
         # Verify the mock was called correctly
         mock_get_help.assert_called_once_with(service, command)
 
-    @pytest.mark.asyncio
-    @pytest.mark.parametrize(
-        "command,mock_response,expected_result,timeout",
-        [
-            # JSON output test
-            (
-                "aws s3 ls --output json",
-                {"status": "success", "output": json.dumps({"Buckets": [{"Name": "test-bucket", "CreationDate": "2023-01-01T00:00:00Z"}]})},
-                {"status": "success", "contains": ["Buckets", "test-bucket"]},
-                None,
-            ),
-            # Text output test
-            (
-                "aws ec2 describe-instances --query 'Reservations[*]' --output text",
-                {"status": "success", "output": "i-12345\trunning\tt2.micro"},
-                {"status": "success", "contains": ["i-12345", "running"]},
-                None,
-            ),
-            # Test with custom timeout
-            ("aws rds describe-db-instances", {"status": "success", "output": "DB instances list"}, {"status": "success", "contains": ["DB instances"]}, 60),
-            # Error case
-            (
-                "aws s3 ls --invalid-flag",
-                {"status": "error", "output": "Unknown options: --invalid-flag"},
-                {"status": "error", "contains": ["--invalid-flag"]},
-                None,
-            ),
-            # Piped command
-            (
-                "aws s3api list-buckets --query 'Buckets[*].Name' --output text | sort",
-                {"status": "success", "output": "bucket1\nbucket2\nbucket3"},
-                {"status": "success", "contains": ["bucket1", "bucket3"]},
-                None,
-            ),
-        ],
-    )
-    @patch("aws_mcp_server.server.execute_aws_command")
-    async def test_aws_cli_pipeline_scenarios(self, mock_execute, mock_aws_environment, command, mock_response, expected_result, timeout):
-        """Test aws_cli_pipeline with various scenarios using table-driven tests."""
-        # Configure the mock response
-        mock_execute.return_value = mock_response
-
-        # Call the aws_cli_pipeline function
-        result = await aws_cli_pipeline(command=command, timeout=timeout, ctx=None)
-
-        # Verify status
-        assert result["status"] == expected_result["status"]
-
-        # Verify expected content is present
-        for content in expected_result["contains"]:
-            assert content in result["output"], f"Expected '{content}' in output"
+    async def test_aws_cli_help_batch(self, mock_aws_environment):
+        """Test that concurrent aws_cli_help calls each get their own help text.
+
+        All cases run concurrently against one patched help lookup.
+        """
+        # Configure the mock response for each (service, command) pair
+        mock_responses = {(service, command): mock_response for service, command, mock_response, _ in HELP_SCENARIOS}
+
+        with patch("aws_mcp_server.server.get_command_help", new_callable=AsyncMock) as mock_get_help:
+            mock_get_help.side_effect = lambda service, command: mock_responses[(service, command)]
+
+            # Call the aws_cli_help function for every case
+            results = await asyncio.gather(*(aws_cli_help(service=service, command=command, ctx=None) for service, command, _, _ in HELP_SCENARIOS))
+
+        # Verify the results
+        for (service, command, _, expected_content), result in zip(HELP_SCENARIOS, results, strict=True):
+            assert "help_text" in result
+            help_text = result["help_text"]
+            for content in expected_content:
+                assert content in help_text, f"Expected '{content}' in help text of {service} {command}"
 
         # Verify the mock was called correctly
-        mock_execute.assert_called_once_with(command, timeout)
+        assert mock_get_help.call_count == len(HELP_SCENARIOS)
+        mock_get_help.assert_has_calls([call(service, command) for service, command, _, _ in HELP_SCENARIOS], any_order=True)
+
+    async def test_aws_cli_pipeline_scenarios(self, mock_aws_environment):
+        """Test aws_cli_pipeline with various scenarios using table-driven tests.
+
+        The cases share one patched executor rather than being parametrized, as none of them raise.
+        """
+        with patch("aws_mcp_server.server.execute_aws_command", new_callable=AsyncMock) as mock_execute:
+            for command, mock_response, expected_result, timeout in PIPELINE_SCENARIOS:
+                # Configure the mock response
+                mock_execute.reset_mock()
+                mock_execute.return_value = mock_response
+
+                # Call the aws_cli_pipeline function
+                result = await aws_cli_pipeline(command=command, timeout=timeout, ctx=None)
+
+                # Verify status
+                assert result["status"] == expected_result["status"], f"Unexpected status for {command}"
+
+                # Verify expected content is present
+                output = result["output"]
+                for content in expected_result["contains"]:
+                    assert content in output, f"Expected '{content}' in output of {command}"
+
+                # Verify the mock was called correctly
+                mock_execute.assert_called_once_with(command, timeout)
 
-    @pytest.mark.asyncio
     @patch("aws_mcp_server.resources.get_aws_profiles")
     @patch("aws_mcp_server.resources.get_aws_regions")
     @patch("aws_mcp_server.resources.get_aws_environment")
@@ -169,16 +193,14 @@ class TestServerIntegration:
         for uri in expected_resources:
             assert uri in resource_uris, f"Resource {uri} not found in resources list"
 
-        # Test accessing each resource by URI
-        for uri in expected_resources:
-            resource = await mcp_client.read_resource(uri=uri)
+        # Test accessing each resource by URI, reading them concurrently
+        resources_read = await asyncio.gather(*(mcp_client.read_resource(uri=uri) for uri in expected_resources))
+        for uri, resource in zip(expected_resources, resources_read, strict=True):
             assert resource is not None, f"Failed to read resource {uri}"
 
             # Resource is a list with one item that has a content attribute
             # The content is a JSON string that needs to be parsed
-            import json
-
-            content = json.loads(resource[0].content)
+            content = orjson.loads(resource[0].content)
 
             # Verify specific resource content
             if uri == "aws://config/profiles":
@@ -2,9 +2,6 @@
 
 import asyncio
 import os
-import subprocess
-import time
-import uuid
 from unittest.mock import AsyncMock, patch
 
 import pytest
@@ -12,23 +9,20 @@ import pytest
 from aws_mcp_server.server import aws_cli_pipeline
 
 
-def test_aws_cli_installed():
+def test_aws_cli_installed(aws_cli_available):
     """Test that AWS CLI is installed."""
-    result = subprocess.run(["aws", "--version"], stdout=subprocess.PIPE, stderr=subprocess.PIPE, check=False)
-    assert result.returncode == 0, "AWS CLI is not installed or not in PATH"
+    assert aws_cli_available, "AWS CLI is not installed or not in PATH"
 
 
 @pytest.mark.integration
-def test_aws_credentials_exist():
+def test_aws_credentials_exist(aws_caller_identity):
     """Test that AWS credentials exist.
 
     This test is marked as integration because it requires AWS credentials.
     """
-    result = subprocess.run(["aws", "sts", "get-caller-identity"], stdout=subprocess.PIPE, stderr=subprocess.PIPE, check=False)
-    assert result.returncode == 0, f"AWS credentials check failed: {result.stderr.decode('utf-8')}"
+    assert aws_caller_identity is not None, "AWS credentials check failed"
 
 
-@pytest.mark.asyncio
 @pytest.mark.integration
 async def test_aws_execute_command():
     """Test that we can execute a basic AWS command.
@@ -44,7 +38,6 @@ async def test_aws_execute_command():
     assert result["status"] == "success", f"Command failed: {result.get('output', '')}"
 
 
-# @pytest.mark.asyncio
 # @pytest.mark.integration
 # async def test_aws_bucket_creation():
 #     """Test that we can create and delete a bucket.
@@ -74,7 +67,6 @@ async def test_aws_execute_command():
 #         await aws_cli_pipeline(command=f"aws s3 rb s3://{bucket_name} --region {region}", timeout=None, ctx=None)
 
 
-@pytest.mark.asyncio
 async def test_aws_command_mocked():
     """Test executing an AWS command with mocked execution.
 
@@ -12,8 +12,7 @@
 
 
 # @pytest.mark.integration
-# @pytest.mark.asyncio
-# async def test_create_and_delete_s3_bucket():
+# async def test_create_and_delete_s3_bucket(tmp_path):
 #     """Test creating and deleting an S3 bucket using AWS MCP server."""
 #     # Get region from environment or use default
 #     region = os.environ.get("AWS_TEST_REGION", AWS_REGION)
@@ -40,12 +39,11 @@
 #         assert bucket_name in list_result["output"], "Bucket not found in bucket list"
 #
 #         # Try to create a test file
-#         test_content = "Test content"
-#         with open("test_file.txt", "w") as f:
-#             f.write(test_content)
+#         test_file = tmp_path / "test_file.txt"
+#         test_file.write_bytes(b"Test content")
 #
 #         # Upload the file
-#         upload_result = await aws_cli_pipeline(command=f"aws s3 cp test_file.txt s3://{bucket_name}/test_file.txt --region {region}", timeout=None, ctx=None)
+#         upload_result = await aws_cli_pipeline(command=f"aws s3 cp {test_file} s3://{bucket_name}/test_file.txt --region {region}", timeout=None, ctx=None)
 #         assert upload_result["status"] == "success", f"Failed to upload file: {upload_result['output']}"
 #
 #         # List bucket contents
@@ -54,10 +52,6 @@
 #
 #     finally:
 #         # Clean up
-#         # Remove test file
-#         if os.path.exists("test_file.txt"):
-#             os.remove("test_file.txt")
-#
 #         # Delete all objects in the bucket
 #         await aws_cli_pipeline(command=f"aws s3 rm s3://{bucket_name} --recursive --region {region}", timeout=None, ctx=None)
 #
@@ -0,0 +1,107 @@
+"""Tests for the FastAPI application module."""
+
+import asyncio
+import threading
+import time
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from fastapi.testclient import TestClient
+
+import aws_mcp_server.api as api
+
+# Account info and region details as returned by successful and failed AWS lookups
+ACCOUNT_INFO = {"account_id": "123456789012", "account_alias": None, "organization_id": None}
+ACCOUNT_INFO_FAILED = {"account_id": None, "account_alias": None, "organization_id": None}
+REGION_DETAILS = {"code": "us-east-1", "availability_zones": [{"name": "us-east-1a"}]}
+REGION_DETAILS_FAILED = {"code": "us-east-1", "availability_zones": []}
+
+
+@pytest.fixture
+def client(monkeypatch):
+    """TestClient with startup checks passing and fresh concurrency and cache state."""
+    monkeypatch.setattr(api, "AWS_CALL_SEMAPHORE", asyncio.Semaphore(api.MAX_CONCURRENT_AWS_CALLS))
+    monkeypatch.setattr(api, "_environment_cache", None)
+
+    with patch("aws_mcp_server.api.check_aws_cli_installed", new_callable=AsyncMock, return_value=True):
+        with TestClient(api.app) as test_client:
+            yield test_client
+
+
+@pytest.fixture
+def blocked_region_details(monkeypatch):
+    """Make region lookups block until released, with a short deadline."""
+    release = threading.Event()
+
+    def get_region_details(region_code):
+        release.wait(5)
+        return REGION_DETAILS
+
+    monkeypatch.setattr(api, "REGION_DETAILS_TIMEOUT", 0.1)
+    monkeypatch.setattr(api, "get_region_details", get_region_details)
+    yield release
+    release.set()
+
+
+def test_aws_call_timeout_returns_503(client, blocked_region_details):
+    """Test that an AWS call exceeding its deadline is shed with a 503 and Retry-After."""
+    response = client.get("/aws/regions/us-east-1")
+
+    assert response.status_code == 503
+    assert response.headers["Retry-After"] == "2"
+    assert response.json() == {"detail": "AWS is not responding, please retry later"}
+
+
+def test_aws_call_slot_held_until_abandoned_call_finishes(client, blocked_region_details, monkeypatch):
+    """Test that a timed out call keeps its slot until the worker thread returns."""
+    monkeypatch.setattr(api, "AWS_CALL_SEMAPHORE", asyncio.Semaphore(1))
+
+    assert client.get("/aws/regions/us-east-1").status_code == 503
+    # The abandoned lookup is still running, so its slot is still taken
+    assert api.AWS_CALL_SEMAPHORE.locked()
+
+    blocked_region_details.set()
+    deadline = time.monotonic() + 5
+    while api.AWS_CALL_SEMAPHORE.locked() and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+    assert not api.AWS_CALL_SEMAPHORE.locked()
+    response = client.get("/aws/regions/us-east-1")
+    assert response.status_code == 200
+    assert response.json() == REGION_DETAILS
+
+
+def test_environment_cache_expires(client, monkeypatch):
+    """Test that environment lookups are reused until ENVIRONMENT_CACHE_TTL has passed."""
+    mock_get_environment = MagicMock(side_effect=[{"aws_profile": "first"}, {"aws_profile": "second"}])
+    monkeypatch.setattr(api, "get_aws_environment", mock_get_environment)
+
+    assert client.get("/aws/environment").json() == {"aws_profile": "first"}
+    assert client.get("/aws/environment").json() == {"aws_profile": "first"}
+    assert mock_get_environment.call_count == 1
+
+    # Move the cached entry's expiry into the past
+    monkeypatch.setattr(api, "_environment_cache", (time.monotonic() - 1, api._environment_cache[1]))
+
+    assert client.get("/aws/environment").json() == {"aws_profile": "second"}
+    assert mock_get_environment.call_count == 2
+
+
+@pytest.mark.parametrize(
+    "path,target,lookup,result,cacheable",
+    [
+        ("/aws/account", "get_aws_account_info", AsyncMock, ACCOUNT_INFO, True),
+        ("/aws/account", "get_aws_account_info", AsyncMock, ACCOUNT_INFO_FAILED, False),
+        ("/aws/regions/us-east-1", "get_region_details", MagicMock, REGION_DETAILS, True),
+        ("/aws/regions/us-east-1", "get_region_details", MagicMock, REGION_DETAILS_FAILED, False),
+    ],
+)
+def test_cache_control_only_on_success(client, monkeypatch, path, target, lookup, result, cacheable):
+    """Test that Cache-Control is only sent for successful account and region lookups."""
+    monkeypatch.setattr(api, target, lookup(return_value=result))
+
+    response = client.get(path)
+
+    assert response.status_code == 200
+    assert response.json() == result
+    assert response.headers.get("Cache-Control") == (api.RESOURCE_CACHE_CONTROL if cacheable else None)
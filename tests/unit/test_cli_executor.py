@@ -1,10 +1,13 @@
 """Tests for the CLI executor module."""
 
 import asyncio
+from collections import OrderedDict
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
+from botocore.exceptions import ClientError, NoCredentialsError
 
+import aws_mcp_server.cli_executor
 from aws_mcp_server.cli_executor import (
     CommandExecutionError,
     CommandValidationError,
@@ -17,14 +20,20 @@ from aws_mcp_server.cli_executor import (
 from aws_mcp_server.config import DEFAULT_TIMEOUT, MAX_OUTPUT_SIZE
 
 
-@pytest.mark.asyncio
-async def test_execute_aws_command_success():
+@pytest.fixture(autouse=True)
+def reset_aws_cli_check(monkeypatch):
+    """Forget cached AWS CLI checks and help text between tests."""
+    monkeypatch.setattr("aws_mcp_server.cli_executor._aws_cli_installed", False)
+    monkeypatch.setattr("aws_mcp_server.cli_executor._aws_cli_version", None)
+    monkeypatch.setattr("aws_mcp_server.cli_executor._aws_cli_check_lock", asyncio.Lock())
+    monkeypatch.setattr("aws_mcp_server.cli_executor._help_cache", OrderedDict())
+
+
+async def test_execute_aws_command_success(make_process):
     """Test successful command execution."""
     with patch("asyncio.create_subprocess_exec", new_callable=AsyncMock) as mock_subprocess:
         # Mock a successful process
-        process_mock = AsyncMock()
-        process_mock.returncode = 0
-        process_mock.communicate.return_value = (b"Success output", b"")
+        process_mock = make_process(0, b"Success output")
         mock_subprocess.return_value = process_mock
 
         result = await execute_aws_command("aws s3 ls")
@@ -34,14 +43,11 @@ async def test_execute_aws_command_success():
         mock_subprocess.assert_called_once_with("aws", "s3", "ls", stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE)
 
 
-@pytest.mark.asyncio
-async def test_execute_aws_command_ec2_with_region_added():
+async def test_execute_aws_command_ec2_with_region_added(make_process):
     """Test that region is automatically added to EC2 commands."""
     with patch("asyncio.create_subprocess_exec", new_callable=AsyncMock) as mock_subprocess:
         # Mock a successful process
-        process_mock = AsyncMock()
-        process_mock.returncode = 0
-        process_mock.communicate.return_value = (b"EC2 instances", b"")
+        process_mock = make_process(0, b"EC2 instances")
         mock_subprocess.return_value = process_mock
 
         # Import here to ensure the test uses the actual value
@@ -63,19 +69,21 @@ async def test_execute_aws_command_ec2_with_region_added():
         assert AWS_REGION in call_args
 
 
-@pytest.mark.asyncio
-async def test_execute_aws_command_with_custom_timeout():
+async def test_execute_aws_command_with_custom_timeout(make_process):
     """Test command execution with custom timeout."""
     with patch("asyncio.create_subprocess_exec", new_callable=AsyncMock) as mock_subprocess:
-        process_mock = AsyncMock()
-        process_mock.returncode = 0
-        process_mock.communicate.return_value = (b"Success output", b"")
+        process_mock = make_process(0, b"Success output")
         mock_subprocess.return_value = process_mock
 
         # Use a custom timeout
         custom_timeout = 120
-        with patch("asyncio.wait_for") as mock_wait_for:
-            mock_wait_for.return_value = (b"Success output", b"")
+
+        def close_and_return(awaitable, timeout):
+            # The output is never read, so close the coroutine instead of leaving it unawaited
+            awaitable.close()
+            return (b"Success output", b"", False)
+
+        with patch("asyncio.wait_for", side_effect=close_and_return) as mock_wait_for:
             await execute_aws_command("aws s3 ls", timeout=custom_timeout)
 
             # Check that wait_for was called with the custom timeout
@@ -84,35 +92,93 @@ async def test_execute_aws_command_with_custom_timeout():
             assert kwargs.get("timeout") == custom_timeout or args[1] == custom_timeout
 
 
-@pytest.mark.asyncio
-async def test_execute_aws_command_error():
+async def test_execute_aws_command_via_boto3():
+    """Test that simple read-only commands are answered by a cached boto3 client."""
+    mock_client = MagicMock()
+    mock_client.get_caller_identity.return_value = {"UserId": "AIDA", "Account": "123456789012", "ResponseMetadata": {"HTTPStatusCode": 200}}
+
+    with (
+        patch("aws_mcp_server.resources.get_default_output", return_value="json"),
+        patch("aws_mcp_server.resources.get_cached_client", return_value=mock_client) as mock_get_client,
+        patch("asyncio.create_subprocess_exec", new_callable=AsyncMock) as mock_subprocess,
+    ):
+        result = await execute_aws_command("aws sts get-caller-identity --region eu-west-1")
+
+        assert result["status"] == "success"
+        assert result["output"] == '{\n    "UserId": "AIDA",\n    "Account": "123456789012"\n}\n'
+        mock_get_client.assert_called_once_with("sts", None, "eu-west-1")
+        mock_subprocess.assert_not_called()
+
+
+@pytest.mark.parametrize(
+    "command,default_output",
+    [
+        # Arguments the fast path does not understand
+        ("aws sts get-caller-identity --query Account", "json"),
+        # Output formats other than JSON
+        ("aws sts get-caller-identity --output text", "json"),
+        ("aws sts get-caller-identity", "table"),
+    ],
+)
+async def test_execute_aws_command_via_boto3_falls_back(make_process, command, default_output):
+    """Test that commands the boto3 path cannot reproduce run through the AWS CLI."""
+    with (
+        patch("aws_mcp_server.resources.get_default_output", return_value=default_output),
+        patch("aws_mcp_server.resources.get_cached_client") as mock_get_client,
+        patch("asyncio.create_subprocess_exec", new_callable=AsyncMock) as mock_subprocess,
+    ):
+        mock_subprocess.return_value = make_process(0, b"CLI output")
+
+        result = await execute_aws_command(command)
+
+        assert result["output"] == "CLI output"
+        mock_get_client.assert_not_called()
+
+
+@pytest.mark.parametrize(
+    "error,expected",
+    [
+        (ClientError({"Error": {"Code": "Throttling", "Message": "Rate exceeded"}}, "GetCallerIdentity"), "Rate exceeded"),
+        (NoCredentialsError(), "Authentication error: Unable to locate credentials"),
+    ],
+)
+async def test_execute_aws_command_via_boto3_error(error, expected):
+    """Test that AWS errors from boto3 are reported without running the AWS CLI."""
+    mock_client = MagicMock()
+    mock_client.get_caller_identity.side_effect = error
+
+    with (
+        patch("aws_mcp_server.resources.get_default_output", return_value="json"),
+        patch("aws_mcp_server.resources.get_cached_client", return_value=mock_client),
+        patch("asyncio.create_subprocess_exec", new_callable=AsyncMock) as mock_subprocess,
+    ):
+        result = await execute_aws_command("aws sts get-caller-identity")
+
+        assert result["status"] == "error"
+        assert expected in result["output"]
+        mock_subprocess.assert_not_called()
+
+
+async def test_execute_aws_command_error(make_process):
     """Test command execution error."""
     with patch("asyncio.create_subprocess_exec", new_callable=AsyncMock) as mock_subprocess:
         # Mock a failed process
-        process_mock = AsyncMock()
-        process_mock.returncode = 1
-        # Set up an awaitable communicate method
-        communicate_mock = AsyncMock()
-        communicate_mock.return_value = (b"", b"Error message")
-        process_mock.communicate = communicate_mock
+        process_mock = make_process(1, b"", b"Error message")
         mock_subprocess.return_value = process_mock
 
         result = await execute_aws_command("aws s3 ls")
 
         assert result["status"] == "error"
         assert result["output"] == "Error message"
-        # Verify communicate was called
-        communicate_mock.assert_called_once()
+        # Verify the process was waited for
+        process_mock.wait.assert_called_once()
 
 
-@pytest.mark.asyncio
-async def test_execute_aws_command_auth_error():
+async def test_execute_aws_command_auth_error(make_process):
     """Test command execution with authentication error."""
     with patch("asyncio.create_subprocess_exec", new_callable=AsyncMock) as mock_subprocess:
         # Mock a process that returns auth error
-        process_mock = AsyncMock()
-        process_mock.returncode = 1
-        process_mock.communicate.return_value = (b"", b"Unable to locate credentials")
+        process_mock = make_process(1, b"", b"Unable to locate credentials")
         mock_subprocess.return_value = process_mock
 
         result = await execute_aws_command("aws s3 ls")
@@ -123,15 +189,13 @@ async def test_execute_aws_command_auth_error():
         assert "Please check your AWS credentials" in result["output"]
 
 
-@pytest.mark.asyncio
-async def test_execute_aws_command_timeout():
+async def test_execute_aws_command_timeout(make_process):
     """Test command timeout."""
     with patch("asyncio.create_subprocess_exec", new_callable=AsyncMock) as mock_subprocess:
         # Mock a process that times out
-        process_mock = AsyncMock()
+        process_mock = make_process()
         # Use a properly awaitable mock that raises TimeoutError
-        communicate_mock = AsyncMock(side_effect=asyncio.TimeoutError())
-        process_mock.communicate = communicate_mock
+        process_mock.stdout.read = AsyncMock(side_effect=asyncio.TimeoutError())
         mock_subprocess.return_value = process_mock
 
         # Mock a regular function instead of an async one for process.kill
@@ -147,15 +211,13 @@ async def test_execute_aws_command_timeout():
         process_mock.kill.assert_called_once()
 
 
-@pytest.mark.asyncio
-async def test_execute_aws_command_kill_failure():
+async def test_execute_aws_command_kill_failure(make_process):
     """Test failure to kill process after timeout."""
     with patch("asyncio.create_subprocess_exec", new_callable=AsyncMock) as mock_subprocess:
         # Mock a process that times out
-        process_mock = AsyncMock()
+        process_mock = make_process()
         # Use a properly awaitable mock that raises TimeoutError
-        communicate_mock = AsyncMock(side_effect=asyncio.TimeoutError())
-        process_mock.communicate = communicate_mock
+        process_mock.stdout.read = AsyncMock(side_effect=asyncio.TimeoutError())
         # Use regular MagicMock since kill() is not an async method
         process_mock.kill = MagicMock(side_effect=Exception("Failed to kill process"))
         mock_subprocess.return_value = process_mock
@@ -167,7 +229,6 @@ async def test_execute_aws_command_kill_failure():
         assert "Command timed out after 1 seconds" in str(excinfo.value)
 
 
-@pytest.mark.asyncio
 async def test_execute_aws_command_general_exception():
     """Test handling of general exceptions during command execution."""
     with patch("asyncio.create_subprocess_exec", side_effect=Exception("Test exception")):
@@ -178,17 +239,13 @@ async def test_execute_aws_command_general_exception():
         assert "Test exception" in str(excinfo.value)
 
 
-@pytest.mark.asyncio
-async def test_execute_aws_command_truncate_output():
+async def test_execute_aws_command_truncate_output(make_process):
     """Test truncation of large outputs."""
     with patch("asyncio.create_subprocess_exec", new_callable=AsyncMock) as mock_subprocess:
         # Mock a successful process with large output
-        process_mock = AsyncMock()
-        process_mock.returncode = 0
-
         # Generate a large output that exceeds MAX_OUTPUT_SIZE
         large_output = "x" * (MAX_OUTPUT_SIZE + 1000)
-        process_mock.communicate.return_value = (large_output.encode("utf-8"), b"")
+        process_mock = make_process(0, large_output.encode("utf-8"))
         mock_subprocess.return_value = process_mock
 
         result = await execute_aws_command("aws s3 ls")
@@ -219,7 +276,6 @@ def test_is_auth_error(error_message, expected_result):
     assert is_auth_error(error_message) == expected_result
 
 
-@pytest.mark.asyncio
 @pytest.mark.parametrize(
     "returncode,stdout,stderr,exception,expected_result",
     [
@@ -253,7 +309,35 @@ async def test_check_aws_cli_installed(returncode, stdout, stderr, exception, ex
                 mock_subprocess.assert_called_once_with("aws", "--version", stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE)
 
 
-@pytest.mark.asyncio
+async def test_check_aws_cli_installed_cached():
+    """Test that a successful AWS CLI check is only run once."""
+    with patch("asyncio.create_subprocess_exec", new_callable=AsyncMock) as mock_subprocess:
+        process_mock = AsyncMock()
+        process_mock.returncode = 0
+        process_mock.communicate.return_value = (b"aws-cli/2.15.0", b"")
+        mock_subprocess.return_value = process_mock
+
+        assert await check_aws_cli_installed() is True
+        assert await check_aws_cli_installed() is True
+        mock_subprocess.assert_called_once()
+
+    assert aws_mcp_server.cli_executor._aws_cli_version == "aws-cli/2.15.0"
+
+
+async def test_check_aws_cli_installed_concurrent():
+    """Test that concurrent first checks share a single AWS CLI process."""
+    with patch("asyncio.create_subprocess_exec", new_callable=AsyncMock) as mock_subprocess:
+        process_mock = AsyncMock()
+        process_mock.returncode = 0
+        process_mock.communicate.return_value = (b"aws-cli/2.15.0", b"")
+        mock_subprocess.return_value = process_mock
+
+        results = await asyncio.gather(*(check_aws_cli_installed() for _ in range(5)))
+
+        assert results == [True] * 5
+        mock_subprocess.assert_called_once()
+
+
 @pytest.mark.parametrize(
     "service,command,mock_type,mock_value,expected_text,expected_call",
     [
@@ -289,22 +373,37 @@ async def test_get_command_help(service, command, mock_type, mock_value, expecte
             mock_execute.assert_called_once_with(expected_call)
 
 
-@pytest.mark.asyncio
+async def test_get_command_help_cached():
+    """Test that successful help lookups are cached per AWS CLI version."""
+    with patch("aws_mcp_server.cli_executor.execute_aws_command", new_callable=AsyncMock) as mock_execute:
+        # Errors are not cached
+        mock_execute.return_value = {"status": "error", "output": "Command failed"}
+        assert (await get_command_help("s3", "ls"))["help_text"] == "Error: Command failed"
+
+        mock_execute.return_value = {"status": "success", "output": "Help text"}
+        assert (await get_command_help("s3", "ls"))["help_text"] == "Help text"
+        assert (await get_command_help("s3", "ls"))["help_text"] == "Help text"
+        assert mock_execute.call_count == 2
+
+        # A different AWS CLI version has its own cache entries
+        with patch("aws_mcp_server.cli_executor._aws_cli_version", "aws-cli/2.99.0"):
+            assert (await get_command_help("s3", "ls"))["help_text"] == "Help text"
+        assert mock_execute.call_count == 3
+
+
 async def test_execute_aws_command_with_pipe():
     """Test execute_aws_command with a piped command."""
     # Test that execute_aws_command calls execute_pipe_command for piped commands
-    with patch("aws_mcp_server.cli_executor.is_pipe_command", return_value=True):
-        with patch("aws_mcp_server.cli_executor.execute_pipe_command", new_callable=AsyncMock) as mock_pipe_exec:
-            mock_pipe_exec.return_value = {"status": "success", "output": "Piped result"}
+    with patch("aws_mcp_server.cli_executor.execute_pipe_command", new_callable=AsyncMock) as mock_pipe_exec:
+        mock_pipe_exec.return_value = {"status": "success", "output": "Piped result"}
 
-            result = await execute_aws_command("aws s3 ls | grep bucket")
+        result = await execute_aws_command("aws s3 ls | grep bucket")
 
-            assert result["status"] == "success"
-            assert result["output"] == "Piped result"
-            mock_pipe_exec.assert_called_once_with("aws s3 ls | grep bucket", None)
+        assert result["status"] == "success"
+        assert result["output"] == "Piped result"
+        mock_pipe_exec.assert_called_once_with("aws s3 ls | grep bucket", None)
 
 
-@pytest.mark.asyncio
 async def test_execute_pipe_command_success():
     """Test successful execution of a pipe command."""
     with patch("aws_mcp_server.cli_executor.validate_pipe_command") as mock_validate:
@@ -319,7 +418,6 @@ async def test_execute_pipe_command_success():
             mock_pipe_exec.assert_called_once_with("aws s3 ls | grep bucket", None)
 
 
-@pytest.mark.asyncio
 async def test_execute_pipe_command_ec2_with_region_added():
     """Test that region is automatically added to EC2 commands in a pipe."""
     with patch("aws_mcp_server.cli_executor.validate_pipe_command"):
@@ -344,7 +442,6 @@ async def test_execute_pipe_command_ec2_with_region_added():
                 mock_pipe_exec.assert_called_once_with(expected_cmd, None)
 
 
-@pytest.mark.asyncio
 async def test_execute_pipe_command_validation_error():
     """Test execute_pipe_command with validation error."""
     with patch("aws_mcp_server.cli_executor.validate_pipe_command", side_effect=CommandValidationError("Invalid pipe command")):
@@ -354,7 +451,6 @@ async def test_execute_pipe_command_validation_error():
         assert "Invalid pipe command" in str(excinfo.value)
 
 
-@pytest.mark.asyncio
 async def test_execute_pipe_command_execution_error():
     """Test execute_pipe_command with execution error."""
     with patch("aws_mcp_server.cli_executor.validate_pipe_command"):
@@ -369,7 +465,6 @@ async def test_execute_pipe_command_execution_error():
 # New test cases to improve coverage
 
 
-@pytest.mark.asyncio
 async def test_execute_pipe_command_timeout():
     """Test timeout handling in piped commands."""
     with patch("aws_mcp_server.cli_executor.validate_pipe_command"):
@@ -384,7 +479,6 @@ async def test_execute_pipe_command_timeout():
             mock_exec.assert_called_once()
 
 
-@pytest.mark.asyncio
 async def test_execute_pipe_command_with_custom_timeout():
     """Test piped command execution with custom timeout."""
     with patch("aws_mcp_server.cli_executor.validate_pipe_command"):
@@ -398,7 +492,6 @@ async def test_execute_pipe_command_with_custom_timeout():
             mock_exec.assert_called_once_with("aws s3 ls | grep bucket", custom_timeout)
 
 
-@pytest.mark.asyncio
 async def test_execute_pipe_command_large_output():
     """Test handling of large output in piped commands."""
     with patch("aws_mcp_server.cli_executor.validate_pipe_command"):
@@ -422,14 +515,11 @@ async def test_execute_pipe_command_large_output():
         (0, b"Warning: deprecated feature", "success", ""),  # Warning on stderr but success exit code
     ],
 )
-@pytest.mark.asyncio
-async def test_execute_aws_command_exit_codes(exit_code, stderr, expected_status, expected_msg):
+async def test_execute_aws_command_exit_codes(exit_code, stderr, expected_status, expected_msg, make_process):
     """Test handling of different process exit codes and stderr output."""
     with patch("asyncio.create_subprocess_exec", new_callable=AsyncMock) as mock_subprocess:
-        process_mock = AsyncMock()
-        process_mock.returncode = exit_code
         stdout = b"Command output" if exit_code == 0 else b""
-        process_mock.communicate.return_value = (stdout, stderr)
+        process_mock = make_process(exit_code, stdout, stderr)
         mock_subprocess.return_value = process_mock
 
         result = await execute_aws_command("aws s3 ls")
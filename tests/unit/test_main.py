@@ -5,7 +5,7 @@ from unittest.mock import MagicMock, patch
 import pytest
 
 # Import handle_interrupt function for direct testing
-from aws_mcp_server.__main__ import handle_interrupt
+from aws_mcp_server.__main__ import handle_interrupt, main
 
 
 def test_handle_interrupt():
@@ -61,3 +61,58 @@ def test_main_transport_validation():
                     mock_exit.assert_called_once_with(1)
                     # Check that mcp.run was not called
                     mock_run.assert_not_called()
+
+
+def test_main_runs_server_with_configured_transport():
+    """Test that main() runs the startup checks and then the server."""
+    with (
+        patch("aws_mcp_server.__main__.TRANSPORT", "stdio"),
+        patch("aws_mcp_server.__main__.uvloop", None),
+        patch("aws_mcp_server.__main__.signal.signal"),
+        patch("aws_mcp_server.__main__.logging.basicConfig") as mock_basic_config,
+        patch("aws_mcp_server.__main__.run_startup_checks") as mock_checks,
+        patch("aws_mcp_server.__main__.mcp.run") as mock_run,
+    ):
+        main()
+
+        mock_basic_config.assert_called_once()
+        mock_checks.assert_called_once()
+        mock_run.assert_called_once_with(transport="stdio")
+
+
+@pytest.mark.parametrize("transport,server_method", [("stdio", "run_stdio_async"), ("sse", "run_sse_async")])
+def test_main_runs_server_on_uvloop(transport, server_method):
+    """Test that main() runs the server coroutine on uvloop when it is available."""
+    mock_uvloop = MagicMock()
+    server_coro = object()
+    with (
+        patch("aws_mcp_server.__main__.TRANSPORT", transport),
+        patch("aws_mcp_server.__main__.uvloop", mock_uvloop),
+        patch("aws_mcp_server.__main__.signal.signal"),
+        patch("aws_mcp_server.__main__.logging.basicConfig"),
+        patch("aws_mcp_server.__main__.run_startup_checks"),
+        patch(f"aws_mcp_server.__main__.mcp.{server_method}", new=MagicMock(return_value=server_coro)),
+        patch("aws_mcp_server.__main__.mcp.run") as mock_run,
+    ):
+        main()
+
+        mock_uvloop.run.assert_called_once_with(server_coro)
+        mock_uvloop.install.assert_not_called()
+        mock_run.assert_not_called()
+
+
+def test_main_exits_on_invalid_transport():
+    """Test that main() exits before running the server on an invalid transport."""
+    with (
+        patch("aws_mcp_server.__main__.TRANSPORT", "invalid"),
+        patch("aws_mcp_server.__main__.signal.signal"),
+        patch("aws_mcp_server.__main__.logging.basicConfig"),
+        patch("aws_mcp_server.__main__.run_startup_checks") as mock_checks,
+        patch("aws_mcp_server.__main__.mcp.run") as mock_run,
+    ):
+        with pytest.raises(SystemExit) as exc_info:
+            main()
+
+        assert exc_info.value.code == 1
+        mock_checks.assert_not_called()
+        mock_run.assert_not_called()
@@ -95,10 +95,13 @@ def test_validate_aws_command_dangerous():
         # Help on dangerous command should be allowed
         validate_aws_command("aws iam create-user --help")
 
-        # Dangerous command with no safe override should raise
-        with pytest.raises(ValueError, match="restricted for security reasons"):
+        # Dangerous command with no safe override should raise, naming the matched prefix
+        with pytest.raises(ValueError, match=r"\(aws ec2 terminate-instances\) is restricted"):
             validate_aws_command("aws ec2 terminate-instances --instance-id i-12345")
 
+        # Commands that only share a service are not restricted
+        validate_aws_command("aws iam list-users")
+
 
 @patch("aws_mcp_server.security.SECURITY_MODE", "strict")
 def test_validate_aws_command_regex():
@@ -148,35 +151,33 @@ def test_validate_aws_command_permissive():
 @patch("aws_mcp_server.security.SECURITY_MODE", "strict")
 def test_validate_pipe_command():
     """Test validation of piped commands."""
-    # Mock the validate_aws_command and validate_unix_command functions
+    # Mock the validate_aws_command function
     with patch("aws_mcp_server.security.validate_aws_command") as mock_aws_validate:
-        with patch("aws_mcp_server.security.validate_unix_command") as mock_unix_validate:
-            # Set up return values
-            mock_unix_validate.return_value = True
-
-            # Test valid piped command
-            validate_pipe_command("aws s3 ls | grep bucket")
-            mock_aws_validate.assert_called_once_with("aws s3 ls")
-
-            # Reset mocks
-            mock_aws_validate.reset_mock()
-            mock_unix_validate.reset_mock()
-
-            # Test command with unrecognized Unix command
-            mock_unix_validate.return_value = False
-            with pytest.raises(ValueError, match="not allowed"):
-                validate_pipe_command("aws s3 ls | unknown_command")
-
-            # Empty command should raise
-            with pytest.raises(ValueError, match="Empty command"):
-                validate_pipe_command("")
-
-            # Empty second command test
-            # Configure split_pipe_command to return a list with an empty second command
-            with patch("aws_mcp_server.security.split_pipe_command") as mock_split_pipe:
-                mock_split_pipe.return_value = ["aws s3 ls", ""]
-                with pytest.raises(ValueError, match="Empty command at position"):
-                    validate_pipe_command("aws s3 ls | ")
+        # Test valid piped command
+        validate_pipe_command("aws s3 ls | grep bucket")
+        mock_aws_validate.assert_called_once_with("aws s3 ls")
+
+        # Reset mocks
+        mock_aws_validate.reset_mock()
+
+        # Test command with unrecognized Unix command
+        with pytest.raises(ValueError, match="Command 'unknown_command' at position 1 in pipe is not allowed"):
+            validate_pipe_command("aws s3 ls | unknown_command")
+
+        # Every stage after the first is checked
+        with pytest.raises(ValueError, match="at position 2 in pipe is not allowed"):
+            validate_pipe_command("aws s3 ls | grep bucket | unknown_command --flag")
+
+        # Empty command should raise
+        with pytest.raises(ValueError, match="Empty command"):
+            validate_pipe_command("")
+
+        # Empty second command test
+        # Configure split_pipe_command to return a list with an empty second command
+        with patch("aws_mcp_server.security.split_pipe_command") as mock_split_pipe:
+            mock_split_pipe.return_value = ["aws s3 ls", ""]
+            with pytest.raises(ValueError, match="Empty command at position"):
+                validate_pipe_command("aws s3 ls | ")
 
 
 @patch("aws_mcp_server.security.SECURITY_MODE", "strict")
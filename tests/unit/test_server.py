@@ -1,6 +1,6 @@
 """Tests for the FastMCP server implementation."""
 
-from unittest.mock import ANY, AsyncMock, patch
+from unittest.mock import ANY, AsyncMock, MagicMock, patch
 
 import pytest
 
@@ -15,7 +15,7 @@ def test_run_startup_checks():
     # This way we don't rely on any actual coroutine behavior in testing
 
     # Test when AWS CLI is installed
-    with patch("aws_mcp_server.server.check_aws_cli_installed") as mock_check:
+    with patch("aws_mcp_server.server.check_aws_cli_installed", new_callable=MagicMock) as mock_check:
         # Don't use the actual coroutine
         mock_check.return_value = None  # Not used when mocking asyncio.run
 
@@ -25,7 +25,7 @@ def test_run_startup_checks():
                 mock_exit.assert_not_called()
 
     # Test when AWS CLI is not installed
-    with patch("aws_mcp_server.server.check_aws_cli_installed") as mock_check:
+    with patch("aws_mcp_server.server.check_aws_cli_installed", new_callable=MagicMock) as mock_check:
         # Don't use the actual coroutine
         mock_check.return_value = None  # Not used when mocking asyncio.run
 
@@ -35,7 +35,6 @@ def test_run_startup_checks():
                 mock_exit.assert_called_once_with(1)
 
 
-@pytest.mark.asyncio
 @pytest.mark.parametrize(
     "service,command,expected_result",
     [
@@ -60,7 +59,6 @@ async def test_aws_cli_help(service, command, expected_result):
         mock_get_help.assert_called_with(service, command)
 
 
-@pytest.mark.asyncio
 async def test_aws_cli_help_with_context():
     """Test the aws_cli_help tool with context."""
     mock_ctx = AsyncMock()
@@ -75,7 +73,6 @@ async def test_aws_cli_help_with_context():
         assert "Fetching help for AWS s3 ls" in mock_ctx.info.call_args[0][0]
 
 
-@pytest.mark.asyncio
 async def test_aws_cli_help_exception_handling():
     """Test exception handling in aws_cli_help."""
     with patch("aws_mcp_server.server.get_command_help", side_effect=Exception("Test exception")):
@@ -86,7 +83,6 @@ async def test_aws_cli_help_exception_handling():
         assert "Test exception" in result["help_text"]
 
 
-@pytest.mark.asyncio
 @pytest.mark.parametrize(
     "command,timeout,expected_result",
     [
@@ -117,7 +113,6 @@ async def test_aws_cli_pipeline_success(command, timeout, expected_result):
             mock_execute.assert_called_with(command, timeout if timeout else ANY)
 
 
-@pytest.mark.asyncio
 async def test_aws_cli_pipeline_with_context():
     """Test the aws_cli_pipeline tool with context."""
     mock_ctx = AsyncMock()
@@ -154,7 +149,29 @@ async def test_aws_cli_pipeline_with_context():
             assert "Command failed" in mock_ctx.warning.call_args[0][0]
 
 
-@pytest.mark.asyncio
+async def test_aws_cli_pipeline_local_command_cached():
+    """Test that local-only commands are answered from the cache until they expire."""
+    with patch.dict("aws_mcp_server.server._local_command_cache", clear=True):
+        with patch("aws_mcp_server.server.execute_aws_command", new_callable=AsyncMock) as mock_execute:
+            mock_execute.return_value = {"status": "success", "output": "aws-cli/2.15.0"}
+
+            first = await aws_cli_pipeline(command="aws --version", timeout=None)
+            second = await aws_cli_pipeline(command="aws  --version ", timeout=None)
+
+            assert first == second == {"status": "success", "output": "aws-cli/2.15.0"}
+            mock_execute.assert_called_once()
+
+            # Once the entry expires the command runs again
+            with patch("aws_mcp_server.server.time.monotonic", return_value=float("inf")):
+                await aws_cli_pipeline(command="aws --version", timeout=None)
+            assert mock_execute.call_count == 2
+
+            # Other commands always reach the AWS CLI
+            await aws_cli_pipeline(command="aws s3 ls", timeout=None)
+            await aws_cli_pipeline(command="aws s3 ls", timeout=None)
+            assert mock_execute.call_count == 4
+
+
 async def test_aws_cli_pipeline_with_context_and_timeout():
     """Test the aws_cli_pipeline tool with context and timeout."""
     mock_ctx = AsyncMock()
@@ -171,7 +188,6 @@ async def test_aws_cli_pipeline_with_context_and_timeout():
             assert "with timeout: 60s" in message
 
 
-@pytest.mark.asyncio
 @pytest.mark.parametrize(
     "command,exception,expected_error_type,expected_message",
     [
@@ -203,7 +219,6 @@ async def test_aws_cli_pipeline_errors(command, exception, expected_error_type,
             mock_execute.assert_called_with(command, ANY)
 
 
-@pytest.mark.asyncio
 async def test_mcp_server_initialization():
     """Test that the MCP server initializes correctly."""
     # Verify server was created with correct name
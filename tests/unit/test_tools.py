@@ -1,14 +1,17 @@
 """Unit tests for the tools module."""
 
 import asyncio
-from unittest.mock import AsyncMock, MagicMock, patch
+import shlex
+from unittest.mock import ANY, AsyncMock, MagicMock, patch
 
 import pytest
 
 from aws_mcp_server.tools import (
     ALLOWED_UNIX_COMMANDS,
+    communicate_with_limit,
+    decode_output,
     execute_piped_command,
-    is_pipe_command,
+    split_command,
     split_pipe_command,
     validate_unix_command,
 )
@@ -33,23 +36,28 @@ def test_validate_unix_command():
         assert not validate_unix_command(cmd), f"Command should be invalid: {cmd}"
 
 
-def test_is_pipe_command():
-    """Test the is_pipe_command function."""
-    # Test commands with pipes
-    assert is_pipe_command("aws s3 ls | grep bucket")
-    assert is_pipe_command("aws s3api list-buckets | jq '.Buckets[].Name' | sort")
-
-    # Test commands without pipes
-    assert not is_pipe_command("aws s3 ls")
-    assert not is_pipe_command("aws ec2 describe-instances")
+@pytest.mark.parametrize(
+    "command",
+    [
+        "aws s3 ls",
+        "  aws\ts3   ls\n",
+        "",
+        "aws s3 cp 's3://bucket/my file.txt' .",
+        'grep "a b"',
+        "grep a\\ b",
+        "aws\x0bs3",
+        "aws\u00a0s3",
+    ],
+)
+def test_split_command(command):
+    """Test that split_command splits like shlex.split."""
+    assert split_command(command) == shlex.split(command)
 
-    # Test commands with pipes in quotes (should not be detected as pipe commands)
-    assert not is_pipe_command("aws s3 ls 's3://my-bucket/file|other'")
-    assert not is_pipe_command('aws ec2 run-instances --user-data "echo hello | grep world"')
 
-    # Test commands with escaped quotes - these should not confuse the parser
-    assert is_pipe_command('aws s3 ls --query "Name=\\"value\\"" | grep bucket')
-    assert not is_pipe_command('aws s3 ls "s3://my-bucket/file\\"|other"')
+def test_split_command_unbalanced_quotes():
+    """Test that split_command rejects unbalanced quotes."""
+    with pytest.raises(ValueError):
+        split_command("grep 'unterminated")
 
 
 def test_split_pipe_command():
@@ -84,20 +92,67 @@ def test_split_pipe_command():
     result = split_pipe_command(cmd)
     assert result == ['aws s3 ls "s3://bucket/file\\"|name"', "grep pattern"]
 
+    # Test commands without a pipe, which are returned as a single command
+    assert split_pipe_command("aws s3 ls") == ["aws s3 ls"]
+    assert split_pipe_command("  aws ec2 describe-instances  ") == ["aws ec2 describe-instances"]
+    assert split_pipe_command("aws s3 ls 's3://my-bucket/file|other'") == ["aws s3 ls 's3://my-bucket/file|other'"]
+    assert split_pipe_command('aws ec2 run-instances --user-data "echo hello | grep world"') == ['aws ec2 run-instances --user-data "echo hello | grep world"']
+    assert split_pipe_command('aws s3 ls "s3://my-bucket/file\\"|other"') == ['aws s3 ls "s3://my-bucket/file\\"|other"']
+    assert split_pipe_command("") == []
+
+
+@pytest.mark.parametrize(
+    "data,limit,expected",
+    [
+        (b"short", 10, "short"),
+        (b"exactly10!", 10, "exactly10!"),
+        (b"x" * 12, 10, "x" * 10 + "\n... (output truncated)"),
+        # Multi-byte characters: 12 bytes but only 4 characters
+        ("\u20ac" * 4, 5, "\u20ac" * 4),
+        ("\u20ac" * 6, 5, "\u20ac" * 5 + "\n... (output truncated)"),
+        # Invalid bytes are replaced rather than raising
+        (b"ok\xff", 10, "ok\ufffd"),
+    ],
+)
+def test_decode_output(data, limit, expected):
+    """Test decoding and truncating command output."""
+    if isinstance(data, str):
+        data = data.encode("utf-8")
+    assert decode_output(data, limit) == expected
+
+
+async def test_communicate_with_limit(make_process):
+    """Test that communicate_with_limit returns complete output under the limit."""
+    process_mock = make_process(0, b"output", b"warning")
+
+    stdout, stderr, truncated = await communicate_with_limit(process_mock, limit=100)
+
+    assert stdout == b"output"
+    assert stderr == b"warning"
+    assert truncated is False
+    process_mock.kill.assert_not_called()
+    process_mock.wait.assert_called_once()
+
 
-@pytest.mark.asyncio
-async def test_execute_piped_command_success():
+async def test_communicate_with_limit_stops_large_output(make_process):
+    """Test that communicate_with_limit kills a process whose output exceeds the limit."""
+    process_mock = make_process(0, b"x" * 100)
+
+    stdout, _, truncated = await communicate_with_limit(process_mock, limit=10)
+
+    assert truncated is True
+    assert len(stdout) > 10
+    process_mock.kill.assert_called_once()
+
+
+async def test_execute_piped_command_success(make_process):
     """Test successful execution of a piped command."""
     with patch("asyncio.create_subprocess_exec", new_callable=AsyncMock) as mock_subprocess:
-        # Mock the first process in the pipe
-        first_process_mock = AsyncMock()
-        first_process_mock.returncode = 0
-        first_process_mock.communicate.return_value = (b"S3 output", b"")
+        # Mock the first process in the pipe, which writes straight into the second
+        first_process_mock = make_process(0)
 
         # Mock the second process in the pipe
-        second_process_mock = AsyncMock()
-        second_process_mock.returncode = 0
-        second_process_mock.communicate.return_value = (b"Filtered output", b"")
+        second_process_mock = make_process(0, b"Filtered output")
 
         # Set up the mock to return different values on subsequent calls
         mock_subprocess.side_effect = [first_process_mock, second_process_mock]
@@ -107,22 +162,33 @@ async def test_execute_piped_command_success():
         assert result["status"] == "success"
         assert result["output"] == "Filtered output"
 
-        # Verify first command was called with correct args
-        mock_subprocess.assert_any_call("aws", "s3", "ls", stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE)
+        # Verify first command writes to an OS pipe
+        mock_subprocess.assert_any_call("aws", "s3", "ls", stdin=None, stdout=ANY, stderr=asyncio.subprocess.PIPE)
 
-        # Verify second command was called with correct args
-        mock_subprocess.assert_any_call("grep", "bucket", stdin=asyncio.subprocess.PIPE, stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE)
+        # Verify second command reads from that pipe
+        mock_subprocess.assert_any_call("grep", "bucket", stdin=ANY, stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE)
+        first_stdout = mock_subprocess.call_args_list[0].kwargs["stdout"]
+        second_stdin = mock_subprocess.call_args_list[1].kwargs["stdin"]
+        assert isinstance(first_stdout, int) and isinstance(second_stdin, int)
 
 
-@pytest.mark.asyncio
-async def test_execute_piped_command_error_first_command():
+async def test_execute_piped_command_three_stages(make_process):
+    """Test that every stage of a longer pipe is started."""
+    with patch("asyncio.create_subprocess_exec", new_callable=AsyncMock) as mock_subprocess:
+        mock_subprocess.side_effect = [make_process(0), make_process(0), make_process(0, b"2\n")]
+
+        result = await execute_piped_command("aws s3 ls | grep bucket | wc -l")
+
+        assert result["status"] == "success"
+        assert result["output"] == "2\n"
+        assert mock_subprocess.call_count == 3
+
+
+async def test_execute_piped_command_error_first_command(make_process):
     """Test error handling in execute_piped_command when first command fails."""
     with patch("asyncio.create_subprocess_exec", new_callable=AsyncMock) as mock_subprocess:
-        # Mock a failed first process
-        process_mock = AsyncMock()
-        process_mock.returncode = 1
-        process_mock.communicate.return_value = (b"", b"Command failed: aws")
-        mock_subprocess.return_value = process_mock
+        # Mock a failed first process feeding a second process that sees no input
+        mock_subprocess.side_effect = [make_process(1, b"", b"Command failed: aws"), make_process(1)]
 
         result = await execute_piped_command("aws s3 ls | grep bucket")
 
@@ -130,19 +196,25 @@ async def test_execute_piped_command_error_first_command():
         assert "Command failed: aws" in result["output"]
 
 
-@pytest.mark.asyncio
-async def test_execute_piped_command_error_second_command():
+async def test_execute_piped_command_broken_pipe_ignored(make_process):
+    """Test that a stage stopped by a broken pipe does not fail the command."""
+    with patch("asyncio.create_subprocess_exec", new_callable=AsyncMock) as mock_subprocess:
+        mock_subprocess.side_effect = [make_process(255, b"", b"[Errno 32] Broken pipe"), make_process(0, b"first line")]
+
+        result = await execute_piped_command("aws s3 ls | head -n 1")
+
+        assert result["status"] == "success"
+        assert result["output"] == "first line"
+
+
+async def test_execute_piped_command_error_second_command(make_process):
     """Test error handling in execute_piped_command when second command fails."""
     with patch("asyncio.create_subprocess_exec", new_callable=AsyncMock) as mock_subprocess:
         # Mock the first process in the pipe (success)
-        first_process_mock = AsyncMock()
-        first_process_mock.returncode = 0
-        first_process_mock.communicate.return_value = (b"S3 output", b"")
+        first_process_mock = make_process(0)
 
         # Mock the second process in the pipe (failure)
-        second_process_mock = AsyncMock()
-        second_process_mock.returncode = 1
-        second_process_mock.communicate.return_value = (b"", b"Command not found: xyz")
+        second_process_mock = make_process(1, b"", b"Command not found: xyz")
 
         # Set up the mock to return different values on subsequent calls
         mock_subprocess.side_effect = [first_process_mock, second_process_mock]
@@ -153,27 +225,25 @@ async def test_execute_piped_command_error_second_command():
         assert "Command not found: xyz" in result["output"]
 
 
-@pytest.mark.asyncio
-async def test_execute_piped_command_timeout():
+async def test_execute_piped_command_timeout(make_process):
     """Test timeout handling in execute_piped_command."""
     with patch("asyncio.create_subprocess_exec", new_callable=AsyncMock) as mock_subprocess:
-        # Mock a process that times out
-        process_mock = AsyncMock()
-        # Use a properly awaitable mock that raises TimeoutError
-        communicate_mock = AsyncMock(side_effect=asyncio.TimeoutError())
-        process_mock.communicate = communicate_mock
-        # Use regular MagicMock since kill() is not an async method
-        process_mock.kill = MagicMock()
-        mock_subprocess.return_value = process_mock
+        # Mock processes whose output never arrives in time
+        process_mocks = [make_process(), make_process()]
+        for process_mock in process_mocks:
+            process_mock.stdout.read = AsyncMock(side_effect=asyncio.TimeoutError())
+            # Use regular MagicMock since kill() is not an async method
+            process_mock.kill = MagicMock()
+        mock_subprocess.side_effect = process_mocks
 
         result = await execute_piped_command("aws s3 ls | grep bucket", timeout=1)
 
         assert result["status"] == "error"
         assert "Command timed out after 1 seconds" in result["output"]
-        process_mock.kill.assert_called_once()
+        for process_mock in process_mocks:
+            process_mock.kill.assert_called_once()
 
 
-@pytest.mark.asyncio
 async def test_execute_piped_command_exception():
     """Test general exception handling in execute_piped_command."""
     with patch("asyncio.create_subprocess_exec", side_effect=Exception("Test exception")):
@@ -184,7 +254,6 @@ async def test_execute_piped_command_exception():
         assert "Test exception" in result["output"]
 
 
-@pytest.mark.asyncio
 async def test_execute_piped_command_empty_command():
     """Test handling of empty commands."""
     result = await execute_piped_command("")
@@ -193,29 +262,38 @@ async def test_execute_piped_command_empty_command():
     assert "Empty command" in result["output"]
 
 
-@pytest.mark.asyncio
-async def test_execute_piped_command_timeout_during_final_wait():
-    """Test timeout handling during wait for the final command in a pipe."""
-    # This test directly tests the branch where a timeout occurs during awaiting the final command
-    with patch("asyncio.wait_for", side_effect=asyncio.TimeoutError()):
-        with patch("aws_mcp_server.tools.split_pipe_command") as mock_split:
-            mock_split.return_value = ["aws s3 ls", "grep bucket"]
+async def test_execute_piped_command_timeout_during_final_wait(make_process):
+    """Test that a timeout while waiting for the pipeline kills every stage."""
+    process_mocks = [make_process(), make_process()]
 
-            # We don't need to mock the subprocess - it won't reach that point
-            # because wait_for will raise a TimeoutError first
-            result = await execute_piped_command("aws s3 ls | grep bucket", timeout=5)
+    async def time_out(awaitable, timeout):
+        # Cancel the gathered waits and consume the cancellation so nothing is left pending
+        awaitable.cancel()
+        try:
+            await awaitable
+        except asyncio.CancelledError:
+            pass
+        raise asyncio.TimeoutError()
 
-            assert result["status"] == "error"
-            assert "Command timed out after 5 seconds" in result["output"]
+    with (
+        patch("asyncio.create_subprocess_exec", new_callable=AsyncMock, side_effect=process_mocks),
+        patch("asyncio.wait_for", side_effect=time_out) as mock_wait_for,
+        patch("aws_mcp_server.tools._kill_processes") as mock_kill_processes,
+    ):
+        result = await execute_piped_command("aws s3 ls | grep bucket", timeout=5)
+
+        assert result["status"] == "error"
+        assert "Command timed out after 5 seconds" in result["output"]
+        assert mock_wait_for.call_args[0][1] == 5
+        mock_kill_processes.assert_called_once_with(process_mocks)
 
 
-@pytest.mark.asyncio
-async def test_execute_piped_command_kill_error_during_timeout():
+async def test_execute_piped_command_kill_error_during_timeout(make_process):
     """Test error handling when killing a process after timeout fails."""
     with patch("asyncio.create_subprocess_exec", new_callable=AsyncMock) as mock_subprocess:
         # Mock a process that times out
-        process_mock = AsyncMock()
-        process_mock.communicate.side_effect = asyncio.TimeoutError()
+        process_mock = make_process()
+        process_mock.stdout.read = AsyncMock(side_effect=asyncio.TimeoutError())
         process_mock.kill = MagicMock(side_effect=Exception("Failed to kill process"))
         mock_subprocess.return_value = process_mock
 
@@ -226,19 +304,15 @@ async def test_execute_piped_command_kill_error_during_timeout():
         process_mock.kill.assert_called_once()
 
 
-@pytest.mark.asyncio
-async def test_execute_piped_command_large_output():
+async def test_execute_piped_command_large_output(make_process):
     """Test output truncation in execute_piped_command."""
     from aws_mcp_server.config import MAX_OUTPUT_SIZE
 
     with patch("asyncio.create_subprocess_exec", new_callable=AsyncMock) as mock_subprocess:
         # Mock a process with large output
-        process_mock = AsyncMock()
-        process_mock.returncode = 0
-
         # Generate output larger than MAX_OUTPUT_SIZE
         large_output = "x" * (MAX_OUTPUT_SIZE + 1000)
-        process_mock.communicate.return_value = (large_output.encode("utf-8"), b"")
+        process_mock = make_process(0, large_output.encode("utf-8"))
         mock_subprocess.return_value = process_mock
 
         result = await execute_piped_command("aws s3 ls")